@@ -15,12 +15,93 @@ Usage:
 
 Notes:
     - Supports addition and subtraction only.
-    - Limits to a maximum of five problems.
+    - `arithmetic_arranger` limits to a maximum of five problems;
+      `arrange_worksheet` lays out any number of problems in rows and pages,
+      and `iter_worksheet`/`write_worksheet` stream them row by row.
     - Returns formatted string for printing.
 
 """
 
-from typing import List
+from decimal import Decimal, localcontext
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+COLUMN_GAP = "    "
+PAGE_BREAK = "\f"
+MAX_DIGITS = 4
+# Longer operands are added with `decimal`, which has no str <-> int digit limit.
+_INT_DIGITS = 4000
+
+Problem = Tuple[str, str, str]  # (first operand, operator, second operand)
+
+def parse_problem(problem: str, max_digits: Optional[int] = MAX_DIGITS) -> Problem:
+    """
+    Split and validate one problem such as "32 + 698".
+
+    Args:
+        problem (str): The problem to parse.
+        max_digits (int, optional): Longest allowed operand; None for no limit.
+
+    Raises:
+        ValueError: For unsupported operators, numbers with more than
+                    `max_digits` digits, or non-digit inputs.
+    """
+    parts = problem.split()
+    if len(parts) != 3:
+        raise ValueError("Error: Each problem must contain two operands and an operator.")
+
+    num1, operator, num2 = parts
+
+    if operator not in ("+", "-"):
+        raise ValueError("Error: Operator must be '+' or '-'.")
+
+    if not (num1.isdigit() and num2.isdigit()):
+        raise ValueError("Error: Numbers must only contain digits.")
+
+    if max_digits is not None and (len(num1) > max_digits or len(num2) > max_digits):
+        if max_digits == MAX_DIGITS:
+            raise ValueError("Error: Numbers cannot be more than four digits.")
+        raise ValueError(f"Error: Numbers cannot be more than {max_digits} digits.")
+
+    return num1, operator, num2
+
+def solve(num1: str, operator: str, num2: str) -> int:
+    """Compute the answer of a parsed problem with integer arithmetic."""
+    if operator == "+":
+        return int(num1) + int(num2)
+    return int(num1) - int(num2)
+
+def _answer(num1: str, operator: str, num2: str) -> str:
+    """Return the answer of a parsed problem as a string, for operands of any length."""
+    if len(num1) <= _INT_DIGITS and len(num2) <= _INT_DIGITS:
+        return str(solve(num1, operator, num2))
+    with localcontext() as context:
+        context.prec = max(len(num1), len(num2)) + 1  # exact: the answer has at most one more digit
+        if operator == "+":
+            return str(Decimal(num1) + Decimal(num2))
+        return str(Decimal(num1) - Decimal(num2))
+
+def _arrange_row(row: List[Problem], show_answers: bool) -> List[str]:
+    """Return the lines of one row of already parsed problems."""
+    first_line = []
+    second_line = []
+    dashes = []
+    results = []
+
+    for num1, operator, num2 in row:
+        width = max(len(num1), len(num2)) + 2  # 2 spaces for operator and at least one space
+
+        first_line.append(num1.rjust(width))
+        second_line.append(operator + " " + num2.rjust(width - 2))
+        dashes.append("-" * width)
+
+        if show_answers:
+            results.append(_answer(num1, operator, num2).rjust(width))
+
+    lines = [COLUMN_GAP.join(first_line), COLUMN_GAP.join(second_line), COLUMN_GAP.join(dashes)]
+    if show_answers:
+        lines.append(COLUMN_GAP.join(results))
+    return lines
 
 def arithmetic_arranger(problems: List[str], show_answers: bool = False) -> str:
     """
@@ -46,46 +127,107 @@ def arithmetic_arranger(problems: List[str], show_answers: bool = False) -> str:
 
     if len(problems) > 5:
         raise ValueError("Error: Too many problems.")
-    
-    first_line = []
-    second_line = []
-    dashes = []
-    results = []
 
-    for problem in problems:
-        parts = problem.split()
-        if len(parts) != 3:
-            raise ValueError("Error: Each problem must contain two operands and an operator.")
-        
-        num1, operator, num2 = parts
-
-        if operator not in ("+", "-"):
-            raise ValueError("Error: Operator must be '+' or '-'.")
-        
-        if not (num1.isdigit() and num2.isdigit()):
-            raise ValueError("Error: Numbers must only contain digits.")
-        
-        if len(num1) > 4 or len(num2) > 4:
-            raise ValueError("Error: Numbers cannot be more than four digits.")
-        
-        width = max(len(num1), len(num2)) + 2  # 2 spaces for operator and at least one space
+    return "\n".join(_arrange_row([parse_problem(p) for p in problems], show_answers))
 
-        first_line.append(num1.rjust(width))
-        second_line.append(operator + " " + num2.rjust(width - 2))
-        dashes.append("-" * width)
+def arrange_worksheet(
+    problems: Iterable[str],
+    show_answers: bool = False,
+    per_row: int = 5,
+    line_width: Optional[int] = None,
+    rows_per_page: Optional[int] = None,
+    max_digits: Optional[int] = MAX_DIGITS,
+) -> str:
+    """
+    Arrange any number of problems into rows and pages.
 
-        if show_answers:
-            result = str(eval(problem))
-            results.append(result.rjust(width))
+    Every row is formatted exactly like `arithmetic_arranger` would format
+    those problems. Rows are separated by a blank line and pages by a
+    form feed, and the whole worksheet is joined once at the end.
 
-    arranged_problems = "    ".join(first_line) + "\n" + \
-                        "    ".join(second_line) + "\n" + \
-                        "    ".join(dashes)
-    
-    if show_answers:
-        arranged_problems += "\n" + "    ".join(results)
+    Args:
+        problems (Iterable[str]): Arithmetic problems, e.g., "32 + 698".
+        show_answers (bool, optional): If True, include the solutions.
+        per_row (int, optional): Problems per row when `line_width` is not given.
+        line_width (int, optional): Fill each row with as many problems as
+            fit in this many characters (at least one per row).
+        rows_per_page (int, optional): Rows per page; None for a single page.
+        max_digits (int, optional): Longest allowed operand; None for
+            arbitrary precision.
 
-    return arranged_problems
+    Returns:
+        str: The arranged worksheet.
+
+    Raises:
+        ValueError: If a problem is invalid (see `parse_problem`).
+    """
+    return "".join(iter_worksheet(problems, show_answers, per_row, line_width, rows_per_page, max_digits))
+
+def iter_worksheet(
+    problems: Iterable[str],
+    show_answers: bool = False,
+    per_row: int = 5,
+    line_width: Optional[int] = None,
+    rows_per_page: Optional[int] = None,
+    max_digits: Optional[int] = MAX_DIGITS,
+) -> Iterator[str]:
+    """
+    Yield a worksheet one finished row at a time.
+
+    Problems are consumed lazily, so memory is bounded by a single row.
+    Each block after the first starts with its separator, so joining the
+    blocks gives exactly `arrange_worksheet`'s output. Arguments are the
+    same as for `arrange_worksheet`.
+
+    Yields:
+        str: The text of one row.
+    """
+    if per_row < 1 or (rows_per_page is not None and rows_per_page < 1):
+        raise ValueError("Error: per_row and rows_per_page must be positive.")
+
+    parsed = (parse_problem(problem, max_digits) for problem in problems)
+    if line_width is None:
+        rows = iter(lambda: list(islice(parsed, per_row)), [])
+    else:
+        rows = _fill_rows(parsed, line_width)
+
+    for index, row in enumerate(rows):
+        block = "\n".join(_arrange_row(row, show_answers))
+        if index:
+            separator = PAGE_BREAK if rows_per_page and index % rows_per_page == 0 else ""
+            block = f"\n{separator}\n{block}"
+        yield block
+
+def write_worksheet(problems: Iterable[str], sink: IO[str], **options) -> int:
+    """
+    Write a worksheet to a file-like object as each row is finished.
+
+    Args:
+        problems (Iterable[str]): Arithmetic problems, e.g., "32 + 698".
+        sink: Any object with a `write(str)` method.
+        **options: Passed to `iter_worksheet`.
+
+    Returns:
+        int: Number of rows written.
+    """
+    rows = 0
+    for rows, block in enumerate(iter_worksheet(problems, **options), 1):
+        sink.write(block)
+    return rows
+
+def _fill_rows(parsed: Iterable[Problem], line_width: int) -> Iterator[List[Problem]]:
+    """Greedily pack problems into rows no wider than `line_width` (at least one per row)."""
+    row: List[Problem] = []
+    used = 0
+    for problem in parsed:
+        width = max(len(problem[0]), len(problem[2])) + 2
+        if row and used + len(COLUMN_GAP) + width > line_width:
+            yield row
+            row, used = [], 0
+        used += width + (len(COLUMN_GAP) if row else 0)
+        row.append(problem)
+    if row:
+        yield row
 
 
 # Main testing block to allow running this script directly
@@ -0,0 +1,103 @@
+"""
+Arithmetic Arranger Benchmarks
+==============================
+
+Rough timings for the arithmetic arranger. Run directly:
+
+    python arithmetic_arranger_benchmark.py
+"""
+
+import os
+import random
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from arithmetic_arranger import (
+    arithmetic_arranger,
+    arrange_worksheet,
+    parse_problem,
+    solve,
+    write_worksheet,
+)
+
+
+def _problems(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        f"{rng.randrange(10 ** rng.randint(1, 4))} {rng.choice('+-')} {rng.randrange(10 ** rng.randint(1, 4))}"
+        for _ in range(size)
+    ]
+
+
+def bench_answers(size: int = 200_000) -> None:
+    """Compare computing answers with eval() and with the integer parser."""
+    print("Answers")
+    problems = _problems(size)
+    start = perf_counter()
+    for problem in problems:
+        eval(problem)
+    evaluated = perf_counter() - start
+
+    start = perf_counter()
+    for problem in problems:
+        solve(*parse_problem(problem))
+    parsed = perf_counter() - start
+    print(f"  {size:,} problems | eval {evaluated / size * 1e9:7.0f} ns | parse + solve {parsed / size * 1e9:7.0f} ns")
+
+
+def bench_worksheet(size: int = 1_000_000) -> None:
+    """Compare one worksheet with calling arithmetic_arranger five problems at a time."""
+    print("Worksheets")
+    problems = _problems(size)
+    for show_answers in (False, True):
+        start = perf_counter()
+        sheet = arrange_worksheet(problems, show_answers)
+        batched = perf_counter() - start
+
+        start = perf_counter()
+        rows = [arithmetic_arranger(problems[i:i + 5], show_answers) for i in range(0, size, 5)]
+        looped = perf_counter() - start
+
+        assert sheet == "\n\n".join(rows), "worksheet rows differ from arithmetic_arranger"
+        print(
+            f"  {size:,} problems | answers={show_answers!s:<5} | worksheet {batched:6.3f}s "
+            f"| 5 at a time {looped:6.3f}s | {len(sheet) / 2**20:6.1f} MiB"
+        )
+
+
+def bench_streaming(size: int = 200_000) -> None:
+    """Compare peak memory of building a worksheet string and streaming it to a file."""
+    print("Streaming worksheets")
+    problems = _problems(10_000)
+
+    def feed():
+        for i in range(size):
+            yield problems[i % len(problems)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "worksheet.txt")
+        for label in ("string", "streamed"):
+            tracemalloc.start()
+            start = perf_counter()
+            if label == "string":
+                with open(filename, "w") as f:
+                    f.write(arrange_worksheet(feed(), show_answers=True))
+            else:
+                with open(filename, "w") as f:
+                    write_worksheet(feed(), f, show_answers=True)
+            elapsed = perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {label:<8} | {size:,} problems | {elapsed:6.3f}s | peak {peak / 2**20:8.2f} MiB")
+
+    digits = 100_000
+    start = perf_counter()
+    arrange_worksheet([f"{'9' * digits} + 1", f"1{'0' * digits} - 1"], show_answers=True, max_digits=None)
+    print(f"  {digits:,}-digit operands | {(perf_counter() - start) * 1e3:7.2f}ms")
+
+
+if __name__ == "__main__":
+    bench_answers()
+    bench_worksheet()
+    bench_streaming()
@@ -7,30 +7,293 @@ transaction history, and spending charts.
 """
 
 from __future__ import annotations
-from typing import List
-from datetime import datetime
-import matplotlib.pyplot as plt
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+from array import array
+from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice
 import csv
 import json
+import multiprocessing
 
 class Transaction:
     """Represents a single transaction in a budget category."""
 
-    def __init__(self, amount: float, description: str = ""):
+    def __init__(self, amount: float, description: str = "", timestamp: Optional[datetime] = None):
         self.amount = float(amount)
         self.description = description
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
 
     def __repr__(self) -> str:
         sign = "+" if self.amount >= 0 else "-"
         return f"{self.timestamp:%Y-%m-%d %H:%M} | {sign}{abs(self.amount):.2f} | {self.description}"
-    
+
+# -------------------------
+# Compact ledger storage
+# -------------------------
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_epoch_us(timestamp: datetime) -> int:
+    """Convert a naive timestamp to integer microseconds since the epoch."""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+def _from_epoch_us(epoch_us: int) -> datetime:
+    """Convert integer microseconds since the epoch back to a naive timestamp."""
+    return _EPOCH + timedelta(microseconds=epoch_us)
+
+class TransactionView:
+    """A read-only, `Transaction`-like view of one row of a `ColumnarLedger`."""
+
+    __slots__ = ("_ledger", "_index")
+
+    def __init__(self, ledger: ColumnarLedger, index: int):
+        self._ledger = ledger
+        self._index = index
+
+    @property
+    def amount(self) -> float:
+        return self._ledger.amounts[self._index]
+
+    @property
+    def description(self) -> str:
+        return self._ledger.strings[self._ledger.description_ids[self._index]]
+
+    @property
+    def timestamp(self) -> datetime:
+        return _from_epoch_us(self._ledger.timestamps[self._index])
+
+    __repr__ = Transaction.__repr__
+
+class ColumnarLedger:
+    """
+    A compact ledger storing transactions in parallel typed arrays.
+
+    Amounts are kept as doubles, timestamps as integer microseconds since
+    the epoch and descriptions as indices into a table of interned strings.
+    Indexing and iteration yield `TransactionView` objects, so the ledger
+    can stand in for a list of `Transaction` objects in a `Category`.
+    The columns support the buffer protocol and can be wrapped without
+    copying, e.g. with `numpy.frombuffer(ledger.amounts)`.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        self.amounts = array("d")
+        self.timestamps = array("q")
+        self.description_ids = array("I")
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.extend(transactions)
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @overload
+    def __getitem__(self, index: int) -> TransactionView: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[TransactionView]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TransactionView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ledger index out of range")
+        return TransactionView(self, index)
+
+    def __iter__(self) -> Iterator[TransactionView]:
+        for i in range(len(self)):
+            yield TransactionView(self, i)
+
+    def __repr__(self) -> str:
+        return f"ColumnarLedger({len(self)} transactions)"
+
+    def append(self, txn: Transaction) -> None:
+        """Append a transaction (or any object with the same attributes)."""
+        self.append_row(txn.amount, txn.description, txn.timestamp)
+
+    def append_row(self, amount: float, description: str, timestamp: datetime) -> None:
+        """Append a transaction given as its raw fields."""
+        self.amounts.append(amount)
+        self.timestamps.append(_to_epoch_us(timestamp))
+        self.description_ids.append(self._intern(description))
+
+    def extend(self, transactions: Iterable[Transaction]) -> None:
+        """Append every transaction in `transactions`."""
+        for txn in transactions:
+            self.append(txn)
+
+    def extend_rows(
+        self,
+        amounts: Sequence[float],
+        descriptions: Sequence[str],
+        timestamps: Sequence[datetime],
+    ) -> None:
+        """Append many transactions given as parallel columns."""
+        self.extend_epoch_rows(amounts, descriptions, map(_to_epoch_us, timestamps))
+
+    def extend_epoch_rows(
+        self,
+        amounts: Iterable[float],
+        descriptions: Iterable[str],
+        timestamps_us: Iterable[int],
+    ) -> None:
+        """Like `extend_rows`, with timestamps given as epoch microseconds."""
+        self.amounts.extend(amounts)
+        self.timestamps.extend(timestamps_us)
+        self.description_ids.extend(map(self._intern, descriptions))
+
+    def pop(self, index: int = -1) -> TransactionView:
+        """Remove a row and return a detached view of it."""
+        detached = ColumnarLedger()
+        detached.append(self[index])
+        self.amounts.pop(index)
+        self.timestamps.pop(index)
+        self.description_ids.pop(index)
+        return detached[0]
+
+    def clear(self) -> None:
+        """Remove every row, keeping the string table."""
+        del self.amounts[:]
+        del self.timestamps[:]
+        del self.description_ids[:]
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns and the string table."""
+        columns = sum(
+            col.itemsize * len(col)
+            for col in (self.amounts, self.timestamps, self.description_ids)
+        )
+        return columns + sum(len(s) for s in self.strings)
+
+    def _intern(self, description: str) -> int:
+        """Return the string-table index for `description`, adding it if new."""
+        string_id = self._string_ids.get(description)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(description)
+            self._string_ids[description] = string_id
+        return string_id
+
+Ledger = Union[List[Transaction], ColumnarLedger]
+
+# -------------------------
+# Time index
+# -------------------------
+
+_DAY_US = 86_400_000_000
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+ROLLUP_PERIODS = ("day", "week", "month")
+
+class _TimeIndex:
+    """
+    Timestamp-sorted view of a ledger with prefix sums and rollups.
+
+    `times` holds epoch microseconds in sorted order (stable with respect
+    to ledger order); `net[i]` and `spent[i]` are the totals of the first
+    `i` transactions in that order. Transactions appended in time order
+    are indexed incrementally; anything else triggers a rebuild. Rollups
+    are order-independent and kept up to date separately, on demand.
+    """
+
+    def __init__(self) -> None:
+        self.times = array("q")
+        self.net = array("d", [0.0])
+        self.spent = array("d", [0.0])
+        self.rollups: Dict[str, Dict[date, List[float]]] = {p: {} for p in ROLLUP_PERIODS}
+        self._period_keys: Dict[int, Tuple[date, date, date]] = {}
+        self._synced = 0
+        self._rollups_synced = 0
+
+    def sync(self, ledger: Ledger) -> None:
+        """Bring the sorted times and prefix sums up to date with `ledger`."""
+        size = len(ledger)
+        if size < self._synced or size < self._rollups_synced:
+            self.__init__()
+        if size == self._synced:
+            return
+
+        new_times, new_amounts = self._columns(ledger, self._synced)
+        self._synced = size
+
+        out_of_order = (self.times and new_times and new_times[0] < self.times[-1]) or any(
+            b < a for a, b in zip(new_times, islice(new_times, 1, None))
+        )
+        if out_of_order:
+            times, amounts = self._columns(ledger, 0)
+            order = sorted(range(len(times)), key=times.__getitem__)
+            self.times = array("q", [times[i] for i in order])
+            self.net = array("d", [0.0])
+            self.spent = array("d", [0.0])
+            new_amounts = [amounts[i] for i in order]
+        else:
+            self.times.extend(new_times)
+        spent = (-a if a < 0 else 0.0 for a in new_amounts)
+        self.net.extend(islice(accumulate(new_amounts, initial=self.net[-1]), 1, None))
+        self.spent.extend(islice(accumulate(spent, initial=self.spent[-1]), 1, None))
+
+    @staticmethod
+    def _columns(ledger: Ledger, start: int) -> Tuple[List[int], List[float]]:
+        """Return `(epoch_us, amount)` columns of `ledger[start:]`."""
+        if isinstance(ledger, ColumnarLedger):
+            return ledger.timestamps[start:].tolist(), ledger.amounts[start:].tolist()
+        txns = ledger[start:]
+        return [_to_epoch_us(t.timestamp) for t in txns], [t.amount for t in txns]
+
+    def sync_rollups(self, ledger: Ledger) -> None:
+        """Fold transactions added since the last call into the rollups."""
+        self.sync(ledger)
+        if self._rollups_synced == len(ledger):
+            return
+        times, amounts = self._columns(ledger, self._rollups_synced)
+        self._rollups_synced = len(ledger)
+
+        daily, weekly, monthly = (self.rollups[p] for p in ROLLUP_PERIODS)
+        keys = self._period_keys
+        for epoch_us, amount in zip(times, amounts):
+            day_number = epoch_us // _DAY_US
+            day_key = keys.get(day_number)
+            if day_key is None:
+                day = date.fromordinal(_EPOCH_ORDINAL + day_number)
+                day_key = keys[day_number] = (
+                    day,
+                    day - timedelta(days=day.weekday()),
+                    day.replace(day=1),
+                )
+            slot = 1 if amount < 0 else 0
+            value = -amount if amount < 0 else amount
+            for rollup, key in zip((daily, weekly, monthly), day_key):
+                totals = rollup.get(key)
+                if totals is None:
+                    totals = rollup[key] = [0.0, 0.0]
+                totals[slot] += value
+
 class Category:
     """Represents a budget category such as Food, Clothing or Entertainment."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, ledger: Optional[Ledger] = None):
+        """
+        Args:
+            name: Category name
+            ledger: Optional ledger backend, e.g. a `ColumnarLedger` for
+                large histories. Defaults to a list of `Transaction` objects.
+        """
         self.name = name
-        self.ledger: List[Transaction] = []
+        self.ledger = ledger if ledger is not None else []
+
+    @property
+    def ledger(self) -> Ledger:
+        """The transactions recorded in this category."""
+        return self._ledger
+
+    @ledger.setter
+    def ledger(self, ledger: Ledger) -> None:
+        # Replacing the ledger invalidates the running balance.
+        self._ledger = ledger
+        self._balance = 0.0
+        self._synced = 0
+        self._index: Optional[_TimeIndex] = None
 
     def __str__(self) -> str:
         header = f"{self.name} Ledger".center(40, "=")
@@ -44,30 +307,210 @@ class Category:
 
     def deposit(self, amount: float, description: str = "") -> None:
         """Record a deposit in this category."""
-        self.ledger.append(Transaction(amount, description))
+        self._append(Transaction(amount, description))
 
     def withdraw(self, amount: float, description: str = "") -> bool:
         """Attempt to withdraw funds from this category."""
         if self.check_funds(amount):
-            self.ledger.append(Transaction(-amount, description))
+            self._append(Transaction(-amount, description))
             return True
         return False
     
     def transfer(self, amount: float, other: Category) -> bool:
         """Transfer funds from this category to another."""
-        if self.check_funds(amount):
-            self.withdraw(amount, f"Transfer to {other.name}")
+        if self.withdraw(amount, f"Transfer to {other.name}"):
             other.deposit(amount, f"Transfer from {self.name}")
             return True
         return False
     
     def get_balance(self) -> float:
-        """Return the current balance of this category."""
-        return sum(txn.amount for txn in self.ledger)
+        """
+        Return the current balance of this category.
+
+        The balance is maintained incrementally, so this is O(1) for
+        ledgers changed through the public API. Transactions appended to
+        `ledger` directly (e.g. when bulk-loading or replaying) are folded
+        in on the next call.
+        """
+        self._sync_balance()
+        return self._balance
     
     def check_funds(self, amount: float) -> bool:
         """Check if enough balance exists to cover `amount`."""
         return self.get_balance() >= amount
+
+    def recalculate_balance(self) -> float:
+        """
+        Recompute the balance from scratch by summing the whole ledger.
+
+        Only needed if existing transactions were modified in place. This
+        also discards the time index used by range queries.
+        """
+        self._balance = 0.0
+        self._synced = 0
+        self._index = None
+        return self.get_balance()
+
+    def bulk_load(
+        self,
+        rows: Iterable[Sequence],
+        check_funds: bool = True,
+    ) -> List[Tuple[int, float, str]]:
+        """
+        Append many transactions in a single batch.
+
+        Each row is `(amount, description)` or `(amount, description, timestamp)`
+        using the ledger's sign convention: positive amounts are deposits and
+        negative amounts are withdrawals. Rows without a timestamp share one
+        `datetime.now()` taken for the whole batch.
+
+        Args:
+            rows: Iterable of transaction rows, in ledger order
+            check_funds: If True, reject withdrawals that the running balance
+                cannot cover, exactly as `withdraw` would. If False, append
+                every row as-is (e.g. when replaying an exported ledger).
+
+        Returns:
+            List of `(row_index, amount, description)` for every rejected
+            withdrawal. Rejected rows are not added to the ledger.
+        """
+        now = datetime.now()
+        amounts: List[float] = []
+        descriptions: List[str] = []
+        timestamps: List[datetime] = []
+        for row in rows:
+            amounts.append(float(row[0]))
+            descriptions.append(row[1] if len(row) > 1 else "")
+            timestamps.append(row[2] if len(row) > 2 and row[2] is not None else now)
+
+        # Running balance after each row, computed in one C-level pass.
+        running = list(accumulate(amounts, initial=self.get_balance()))
+        balance = running[-1]
+        rejected: List[Tuple[int, float, str]] = []
+
+        if check_funds and any(
+            after < 0 for amount, after in zip(amounts, islice(running, 1, None)) if amount < 0
+        ):
+            # Some withdrawal overdraws; replay sequentially so that each
+            # rejection is reflected in the balance seen by later rows.
+            balance = running[0]
+            keep = []
+            for i, amount in enumerate(amounts):
+                if amount < 0 and balance < -amount:
+                    rejected.append((i, amount, descriptions[i]))
+                    continue
+                balance += amount
+                keep.append(i)
+            amounts = [amounts[i] for i in keep]
+            descriptions = [descriptions[i] for i in keep]
+            timestamps = [timestamps[i] for i in keep]
+
+        self._sync_balance()
+        if isinstance(self.ledger, ColumnarLedger):
+            self.ledger.extend_rows(amounts, descriptions, timestamps)
+        else:
+            self.ledger.extend(map(Transaction, amounts, descriptions, timestamps))
+        self._balance = balance
+        self._synced = len(self.ledger)
+        return rejected
+
+    # -------------------------
+    # Time-range queries
+    # -------------------------
+
+    def balance_at(self, when: datetime) -> float:
+        """Return the balance including every transaction up to and at `when`."""
+        index = self._time_index()
+        return index.net[bisect_right(index.times, _to_epoch_us(when))]
+
+    def net_between(self, start: datetime, end: datetime) -> float:
+        """Return the net change from transactions in `[start, end)`."""
+        index = self._time_index()
+        lo, hi = self._range(index, start, end)
+        return index.net[hi] - index.net[lo]
+
+    def spent_between(self, start: datetime, end: datetime) -> float:
+        """Return the total withdrawn by transactions in `[start, end)`."""
+        index = self._time_index()
+        lo, hi = self._range(index, start, end)
+        return index.spent[hi] - index.spent[lo]
+
+    def rollup(self, period: str = "day") -> Dict[date, Tuple[float, float]]:
+        """
+        Return deposit and spending totals per period.
+
+        Args:
+            period: "day", "week" (starting Monday) or "month"
+
+        Returns:
+            Dict mapping each period's first day to `(deposited, spent)`,
+            in chronological order
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"period must be one of {ROLLUP_PERIODS}, got {period!r}")
+        index = self._time_index()
+        index.sync_rollups(self.ledger)
+        totals = index.rollups[period]
+        return {key: tuple(totals[key]) for key in sorted(totals)}
+
+    def balance_history(self) -> Tuple[List[datetime], List[float]]:
+        """Return timestamps and running balances in chronological order."""
+        index = self._time_index()
+        return [_from_epoch_us(ts) for ts in index.times], index.net[1:].tolist()
+
+    def balance_columns(self) -> Tuple[array, array]:
+        """
+        Return the raw columns behind `balance_history`.
+
+        Returns:
+            (times, balances): epoch microseconds (`array("q")`) and running
+            balances (`array("d")`) in chronological order, as copies
+        """
+        index = self._time_index()
+        return index.times[:], index.net[1:]
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _append(self, txn: Transaction) -> None:
+        """Append `txn` to the ledger and update the running balance."""
+        self._sync_balance()
+        self.ledger.append(txn)
+        self._balance += txn.amount
+        self._synced += 1
+
+    def _time_index(self) -> _TimeIndex:
+        """Return the time index, bringing it up to date with the ledger."""
+        if self._index is None:
+            self._index = _TimeIndex()
+        self._index.sync(self.ledger)
+        return self._index
+
+    @staticmethod
+    def _range(index: _TimeIndex, start: datetime, end: datetime) -> Tuple[int, int]:
+        """Return index positions bounding transactions in `[start, end)`."""
+        lo = bisect_left(index.times, _to_epoch_us(start))
+        hi = bisect_left(index.times, _to_epoch_us(end))
+        return lo, max(lo, hi)
+
+    def _sync_balance(self) -> None:
+        """Fold any transactions added outside the public API into the balance."""
+        size = len(self.ledger)
+        if size == self._synced:
+            return
+        if size < self._synced:
+            # The ledger shrank (e.g. cleared or popped); start over.
+            self._balance = 0.0
+            self._synced = 0
+        # Slice by position: islice would walk the ledger from the start.
+        if isinstance(self.ledger, ColumnarLedger):
+            amounts = self.ledger.amounts[self._synced:]
+        else:
+            amounts = (txn.amount for txn in self.ledger[self._synced:])
+        for amount in amounts:
+            self._balance += amount
+        self._synced = size
     
     # -------------------------
     # Data export
@@ -82,22 +525,122 @@ class Category:
                 writer.writerow([txn.timestamp, txn.amount, txn.description])
 
     def export_json(self, filename: str) -> None:
-        """Export this category's transactions to JSON."""
-        data = [
-            {
-                "date": txn.timestamp.isoformat(),
-                "amount": txn.amount,
-                "description": txn.description,
-            }
-            for txn in self.ledger
-        ]
+        """
+        Export this category's transactions to JSON.
+
+        Records are encoded and written one at a time, so memory use does
+        not grow with the ledger. See `budget_io` for JSON Lines, gzip and
+        import support.
+        """
         with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+            if not len(self.ledger):
+                f.write("[]")
+                return
+            separator = "[\n  "
+            for txn in self.ledger:
+                record = {
+                    "date": txn.timestamp.isoformat(),
+                    "amount": txn.amount,
+                    "description": txn.description,
+                }
+                # Same layout as json.dump(records, f, indent=2).
+                f.write(separator + json.dumps(record, indent=2).replace("\n", "\n  "))
+                separator = ",\n  "
+            f.write("\n]")
+
+    def export_snapshot(self, filename: str) -> None:
+        """
+        Export this category's transactions to a binary snapshot.
+
+        See `budget_io.write_snapshot` to store several categories in one
+        file and `budget_io.Snapshot` to open it.
+        """
+        from budget_io import write_snapshot
+        write_snapshot([self], filename)
 
 # -------------------------
 # Visualization
 # -------------------------
 
+DOWNSAMPLE_METHODS = ("minmax", "lttb")
+
+def _pyplot():
+    """Import pyplot on first use, so importing this module stays cheap."""
+    import matplotlib.pyplot as plt
+    return plt
+
+def _total_spent(category: Category) -> float:
+    """Return the total withdrawn from `category`."""
+    ledger = category.ledger
+    amounts = ledger.amounts if isinstance(ledger, ColumnarLedger) else (txn.amount for txn in ledger)
+    return sum(-amount for amount in amounts if amount < 0)
+
+def downsample_minmax(ys: Sequence[float], max_points: int) -> List[int]:
+    """
+    Pick at most `max_points` indices of `ys` preserving its visual envelope.
+
+    The series is split into equal buckets and the minimum and maximum of
+    each bucket are kept (in order), along with the first and last points.
+    With fewer than 4 points allowed, only the first and last are kept.
+    """
+    if max_points < 2:
+        raise ValueError(f"max_points must be at least 2, got {max_points}")
+    n = len(ys)
+    if n <= max_points or max_points < 4:
+        return list(range(n)) if n <= max_points else [0, n - 1]
+    buckets = max(1, (max_points - 2) // 2)
+    size = (n - 2) / buckets
+    keep = [0]
+    for b in range(buckets):
+        lo = 1 + int(b * size)
+        hi = 1 + int((b + 1) * size)
+        if lo >= hi:
+            continue
+        low = min(range(lo, hi), key=ys.__getitem__)
+        high = max(range(lo, hi), key=ys.__getitem__)
+        keep.extend(sorted({low, high}))
+    keep.append(n - 1)
+    return keep
+
+def downsample_lttb(xs: Sequence[float], ys: Sequence[float], max_points: int) -> List[int]:
+    """
+    Pick at most `max_points` indices using Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+    """
+    if max_points < 2:
+        raise ValueError(f"max_points must be at least 2, got {max_points}")
+    n = len(ys)
+    if n <= max_points or max_points < 3:
+        return list(range(n)) if n <= max_points else [0, n - 1]
+    size = (n - 2) / (max_points - 2)
+    keep = [0]
+    a = 0
+    for b in range(max_points - 2):
+        lo = 1 + int(b * size)
+        hi = 1 + int((b + 1) * size)
+        next_lo = hi
+        next_hi = min(1 + int((b + 2) * size), n)
+        if next_lo >= next_hi:
+            avg_x, avg_y = xs[n - 1], ys[n - 1]
+        else:
+            count = next_hi - next_lo
+            avg_x = sum(xs[next_lo:next_hi]) / count
+            avg_y = sum(ys[next_lo:next_hi]) / count
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = lo, -1.0
+        for i in range(lo, hi):
+            area = abs((ax - avg_x) * (ys[i] - ay) - (ax - xs[i]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = i, area
+        keep.append(best)
+        a = best
+    keep.append(n - 1)
+    return keep
+
 def plot_spending(categories: List[Category], filename: str = "spending.png") -> None:
     """
     Generate a bar chart and pie chart showing spending per category.
@@ -106,11 +649,9 @@ def plot_spending(categories: List[Category], filename: str = "spending.png") ->
         categories: List of Category objects
         filename: Filename to save combined chart image
     """
+    plt = _pyplot()
     labels = [c.name for c in categories]
-    spent = [
-        sum(-txn.amount for txn in c.ledger if txn.amount < 0)
-        for c in categories
-    ]
+    spent = [_total_spent(c) for c in categories]
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 
@@ -128,28 +669,43 @@ def plot_spending(categories: List[Category], filename: str = "spending.png") ->
     plt.savefig(filename)
     plt.close()
 
-def plot_balance_over_time(categories: List[Category], filename: str = "balances.png") -> None:
+def plot_balance_over_time(
+    categories: List[Category],
+    filename: str = "balances.png",
+    max_points: Optional[int] = 2000,
+    downsample: str = "minmax",
+) -> None:
     """
     Generate a line chart showing balance over time for each category.
 
     Args:
         categories: List of Category objects
         filename: Filename to save chart
+        max_points: Maximum points drawn per category (at least 2); longer
+            series are downsampled and drawn without markers. None draws
+            every transaction.
+        downsample: Downsampling method, "minmax" or "lttb"
     """
+    if downsample not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"downsample must be one of {DOWNSAMPLE_METHODS}, got {downsample!r}")
+    if max_points is not None and max_points < 2:
+        raise ValueError(f"max_points must be at least 2, got {max_points}")
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(10, 6))
 
     for category in categories:
-        txns = sorted(category.ledger, key=lambda t: t.timestamp)
-
-        balances = []
-        running_total = 0
-        dates = []
-        for txn in txns:
-            running_total += txn.amount
-            balances.append(running_total)
-            dates.append(txn.timestamp)
-
-        ax.plot(dates, balances, marker="o", label=category.name)
+        times, balances = category.balance_columns()
+        downsampled = max_points is not None and len(times) > max_points
+        if downsampled:
+            if downsample == "lttb":
+                keep = downsample_lttb(times, balances, max_points)
+            else:
+                keep = downsample_minmax(balances, max_points)
+            times = [times[i] for i in keep]
+            balances = [balances[i] for i in keep]
+        dates = [_from_epoch_us(ts) for ts in times]
+        # Markers would suggest the kept points are the only transactions.
+        ax.plot(dates, balances, marker=None if downsampled else "o", label=category.name)
 
     ax.set_title("Balance Over Time")
     ax.set_xlabel("Date")
@@ -161,4 +717,46 @@ def plot_balance_over_time(categories: List[Category], filename: str = "balances
     plt.tight_layout()
     plt.savefig(filename)
     plt.close()
-    
\ No newline at end of file
+
+# -------------------------
+# Batch rendering
+# -------------------------
+
+ReportJob = Tuple[Callable[..., None], List[Category], str]
+
+def _init_render_worker() -> None:
+    """Select a non-interactive backend in each rendering worker."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+def _render_job(job: ReportJob) -> str:
+    plot, categories, filename = job
+    plot(categories, filename)
+    return filename
+
+def render_reports(
+    jobs: Iterable[ReportJob],
+    processes: Optional[int] = None,
+    maxtasksperchild: Optional[int] = 100,
+) -> List[str]:
+    """
+    Render many charts in a process pool.
+
+    Args:
+        jobs: `(plot_function, categories, filename)` tuples, e.g.
+            `(plot_spending, [food, rent], "alice_spending.png")`
+        processes: Worker count; defaults to the number of CPUs. Use 1 to
+            render in the current process.
+        maxtasksperchild: Recycle workers after this many charts to keep
+            matplotlib's memory use bounded
+
+    Returns:
+        Filenames written, in job order
+    """
+    jobs = list(jobs)
+    if processes == 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+    with multiprocessing.Pool(
+        processes, initializer=_init_render_worker, maxtasksperchild=maxtasksperchild
+    ) as pool:
+        return pool.map(_render_job, jobs, chunksize=1)
@@ -0,0 +1,289 @@
+"""
+Budget App Benchmarks
+=====================
+
+Rough timings for the budget module. Run directly:
+
+    python budget_benchmark.py
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+
+import budget_io
+from budget_journal import SYNC_MODES, Journal
+from budget_manager import Budget
+from budget import Category, ColumnarLedger, plot_balance_over_time, plot_spending, render_reports
+
+
+def bench_balance_lookup(sizes=(1_000, 10_000, 100_000), lookups: int = 10_000) -> None:
+    """Show that balance lookups stay flat as the ledger grows."""
+    print("Balance lookups")
+    for size in sizes:
+        category = Category("Bench")
+        start = perf_counter()
+        for i in range(size):
+            if i % 2:
+                category.withdraw(1, "Spend")
+            else:
+                category.deposit(2, "Income")
+        build = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(lookups):
+            category.get_balance()
+        lookup = (perf_counter() - start) / lookups
+
+        print(
+            f"  {size:>9,} txns | build {build:7.3f}s "
+            f"| get_balance {lookup * 1e9:8.1f} ns/call"
+        )
+
+
+def bench_ledger_memory(size: int = 200_000) -> None:
+    """Compare memory used by list-of-objects and columnar ledgers."""
+    print("Ledger memory")
+    descriptions = ["Groceries", "Rent", "Paycheck", "Gas", "Takeout"]
+    for label, make_ledger in (("list", list), ("columnar", ColumnarLedger)):
+        tracemalloc.start()
+        category = Category("Bench", ledger=make_ledger())
+        for i in range(size):
+            category.deposit(i % 100, descriptions[i % len(descriptions)])
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {label:>8} | {size:,} txns | {current / size:6.1f} bytes/txn")
+
+
+def bench_bulk_load(size: int = 1_000_000) -> None:
+    """Compare per-call deposits/withdrawals with a single bulk_load."""
+    print("Ingestion")
+    rows = [(-1.0 if i % 2 else 2.0, "Feed") for i in range(size)]
+
+    category = Category("Bench")
+    start = perf_counter()
+    for amount, description in rows:
+        if amount < 0:
+            category.withdraw(-amount, description)
+        else:
+            category.deposit(amount, description)
+    print(f"  {'per-call':>9} | {size:,} rows | {perf_counter() - start:7.3f}s")
+
+    for label, make_ledger in (("bulk", list), ("bulk+col", ColumnarLedger)):
+        category = Category("Bench", ledger=make_ledger())
+        start = perf_counter()
+        category.bulk_load(rows)
+        print(f"  {label:>9} | {size:,} rows | {perf_counter() - start:7.3f}s")
+
+
+def bench_streaming_io(size: int = 1_000_000, chunk_size: int = budget_io.DEFAULT_CHUNK_SIZE) -> None:
+    """Report streaming export/import throughput for each ledger format."""
+    print("Streaming import/export")
+    category = Category("Bench", ledger=ColumnarLedger())
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        category.bulk_load(
+            [(-1.0 if i % 2 else 2.0, "Feed") for i in range(start, stop)],
+            check_funds=False,
+        )
+
+    formats = (
+        ("csv", budget_io.write_csv, budget_io.read_csv),
+        ("csv.gz", budget_io.write_csv, budget_io.read_csv),
+        ("jsonl", budget_io.write_jsonl, budget_io.read_jsonl),
+        ("jsonl.gz", budget_io.write_jsonl, budget_io.read_jsonl),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext, write, read in formats:
+            filename = os.path.join(tmp, f"ledger.{ext}")
+            start = perf_counter()
+            write(category, filename, chunk_size)
+            written = perf_counter() - start
+
+            start = perf_counter()
+            read(filename, ledger=ColumnarLedger(), chunk_size=chunk_size)
+            loaded = perf_counter() - start
+
+            print(
+                f"  {ext:>8} | {size:,} rows | {os.path.getsize(filename) / 2**20:7.1f} MiB "
+                f"| write {size / written:10,.0f} rows/s | read {size / loaded:10,.0f} rows/s"
+            )
+
+
+def bench_snapshot(size: int = 1_000_000, categories: int = 4) -> None:
+    """Compare opening a binary snapshot with re-reading a CSV export."""
+    print("Binary snapshots")
+    per_category = size // categories
+    cats = []
+    for c in range(categories):
+        category = Category(f"Cat{c}", ledger=ColumnarLedger())
+        category.bulk_load(
+            [(-1.0 if i % 2 else 2.0, "Feed") for i in range(per_category)],
+            check_funds=False,
+        )
+        cats.append(category)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap = os.path.join(tmp, "budget.snap")
+        start = perf_counter()
+        budget_io.write_snapshot(cats, snap)
+        print(f"  write snapshot      | {size:,} rows | {perf_counter() - start:7.3f}s")
+
+        start = perf_counter()
+        with budget_io.Snapshot(snap) as snapshot:
+            balances = [snapshot.balance(name) for name in snapshot.names]
+        print(f"  open + balances     | {len(balances)} categories | {(perf_counter() - start) * 1e3:7.3f}ms")
+
+        start = perf_counter()
+        with budget_io.Snapshot(snap) as snapshot:
+            snapshot.load_all(columnar=True)
+        print(f"  full load           | {size:,} rows | {perf_counter() - start:7.3f}s")
+
+        csv_file = os.path.join(tmp, "cat0.csv")
+        budget_io.write_csv(cats[0], csv_file)
+        start = perf_counter()
+        budget_io.read_csv(csv_file, ledger=ColumnarLedger())
+        elapsed = (perf_counter() - start) * categories
+        print(f"  CSV load (scaled)   | {size:,} rows | {elapsed:7.3f}s")
+
+
+def bench_range_queries(sizes=(10_000, 100_000, 1_000_000), queries: int = 1_000) -> None:
+    """Compare indexed range queries with a full ledger scan."""
+    print("Time-range queries")
+    base = datetime(2020, 1, 1)
+    for size in sizes:
+        category = Category("Bench", ledger=ColumnarLedger())
+        category.bulk_load(
+            [(-1.0 if i % 2 else 2.0, "Feed", base + timedelta(minutes=i)) for i in range(size)],
+            check_funds=False,
+        )
+        windows = []
+        for _ in range(queries):
+            start = base + timedelta(minutes=random.randrange(size))
+            windows.append((start, start + timedelta(days=7)))
+
+        start = perf_counter()
+        category.spent_between(*windows[0])
+        build = perf_counter() - start
+
+        start = perf_counter()
+        for lo, hi in windows:
+            category.spent_between(lo, hi)
+        indexed = (perf_counter() - start) / queries
+
+        lo, hi = windows[0]
+        start = perf_counter()
+        sum(-t.amount for t in category.ledger if lo <= t.timestamp < hi and t.amount < 0)
+        scan = perf_counter() - start
+
+        print(
+            f"  {size:>9,} txns | index build {build:6.3f}s "
+            f"| indexed {indexed * 1e6:6.1f} us/query | full scan {scan * 1e3:8.1f} ms/query"
+        )
+
+
+def bench_rendering(size: int = 200_000, reports: int = 8) -> None:
+    """Time module import, downsampled plotting and batch report rendering."""
+    print("Rendering")
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", "import budget"], check=True)
+    print(f"  import budget (fresh process)  | {perf_counter() - start:7.3f}s")
+
+    base = datetime(2020, 1, 1)
+    category = Category("Bench", ledger=ColumnarLedger())
+    category.bulk_load(
+        [(random.uniform(-1, 1.1), "Feed", base + timedelta(minutes=i)) for i in range(size)],
+        check_funds=False,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, max_points in (("all points", None), ("minmax 2000", 2000)):
+            start = perf_counter()
+            plot_balance_over_time([category], os.path.join(tmp, "balance.png"), max_points=max_points)
+            print(f"  {label:<14} | {size:,} txns | {perf_counter() - start:7.3f}s")
+
+        jobs = [
+            (plot_spending if i % 2 else plot_balance_over_time, [category], os.path.join(tmp, f"r{i}.png"))
+            for i in range(reports)
+        ]
+        for processes in (1, None):
+            start = perf_counter()
+            render_reports(jobs, processes=processes)
+            label = "serial" if processes == 1 else "pool"
+            print(f"  {reports} reports, {label:<6} | {perf_counter() - start:7.3f}s")
+
+
+def bench_concurrent_transfers(threads=(1, 2, 4, 8), ops: int = 200_000, categories: int = 64) -> None:
+    """Stress random transfers across threads and check money is conserved."""
+    print("Concurrent transfers")
+    names = [f"Cat{i}" for i in range(categories)]
+    for workers in threads:
+        budget = Budget(Category(name) for name in names)
+        for name in names:
+            budget.deposit(name, 1_000, "Seed")
+        total = sum(budget.balances().values())
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(ops // workers):
+                source, destination = rng.sample(names, 2)
+                budget.transfer(source, destination, rng.randint(1, 50))
+
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        start = perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = perf_counter() - start
+
+        balances = budget.balances()
+        assert abs(sum(balances.values()) - total) < 1e-6, "money was created or destroyed"
+        assert min(balances.values()) >= 0, "a category was overdrawn"
+        print(f"  {workers} threads | {ops / elapsed:10,.0f} transfers/s")
+
+
+def bench_journal(ops: int = 20_000) -> None:
+    """Report journaled operations per second under each durability mode."""
+    print("Journaled operations")
+    with tempfile.TemporaryDirectory() as tmp:
+        for sync in ("off",) + SYNC_MODES:
+            path = os.path.join(tmp, f"{sync}.journal")
+            journal = None if sync == "off" else Journal(path, sync=sync)
+            budget = Budget([Category("Food"), Category("Rent")], journal=journal)
+            count = ops // 10 if sync == "always" else ops
+            start = perf_counter()
+            for i in range(count):
+                if i % 3 == 0:
+                    budget.deposit("Food", 10, "Paycheck")
+                elif i % 3 == 1:
+                    budget.withdraw("Food", 3, "Groceries")
+                else:
+                    budget.transfer("Food", "Rent", 1)
+            if journal is not None:
+                journal.close()
+            elapsed = perf_counter() - start
+
+            replay = "-"
+            if journal is not None:
+                start = perf_counter()
+                Budget.recover(os.path.join(tmp, "missing.snap"), path).journal.close()
+                replay = f"{count / (perf_counter() - start):,.0f}"
+            print(f"  sync={sync:<6} | {count / elapsed:10,.0f} ops/s | replay {replay:>10} ops/s")
+
+
+if __name__ == "__main__":
+    bench_balance_lookup()
+    bench_ledger_memory()
+    bench_bulk_load()
+    bench_streaming_io()
+    bench_snapshot()
+    bench_range_queries()
+    bench_rendering()
+    bench_concurrent_transfers()
+    bench_journal()
@@ -0,0 +1,512 @@
+"""
+Budget App Import/Export
+========================
+
+Streaming readers and writers for budget ledgers. Ledgers are processed
+in fixed-size chunks so memory stays bounded regardless of ledger size.
+
+Supported formats:
+    - CSV with the same columns as `Category.export_csv`
+    - JSON Lines with the same fields as `Category.export_json`
+    - Binary snapshots of many categories, opened through `mmap`
+
+Any CSV or JSON Lines filename ending in ".gz" is transparently
+gzip-compressed.
+"""
+
+from __future__ import annotations
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+from itertools import islice
+import csv
+import gzip
+import json
+import mmap
+import os
+import struct
+
+from budget import Category, ColumnarLedger, Ledger, _from_epoch_us, _to_epoch_us
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+Row = Tuple[float, str, datetime]
+
+# -------------------------
+# Helpers
+# -------------------------
+
+def _open_text(filename: str, mode: str) -> IO[str]:
+    """Open `filename` in text mode, using gzip for ".gz" files."""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", newline="", encoding="utf-8")
+    return open(filename, mode, newline="", encoding="utf-8")
+
+def _category_name(filename: str) -> str:
+    """Derive a category name from a ledger filename, e.g. "food.csv.gz" -> "food"."""
+    base = os.path.basename(filename)
+    if base.endswith(".gz"):
+        base = base[:-3]
+    return os.path.splitext(base)[0]
+
+def iter_ledger_chunks(ledger: Ledger, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Row]]:
+    """Yield the ledger as lists of `(amount, description, timestamp)` rows."""
+    if isinstance(ledger, ColumnarLedger):
+        strings = ledger.strings
+        for start in range(0, len(ledger), chunk_size):
+            stop = start + chunk_size
+            yield [
+                (amount, strings[desc_id], _from_epoch_us(ts))
+                for amount, desc_id, ts in zip(
+                    ledger.amounts[start:stop],
+                    ledger.description_ids[start:stop],
+                    ledger.timestamps[start:stop],
+                )
+            ]
+        return
+
+    txns = iter(ledger)
+    while True:
+        chunk = [(t.amount, t.description, t.timestamp) for t in islice(txns, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+# -------------------------
+# Writers
+# -------------------------
+
+def write_csv(category: Category, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream a category's ledger to CSV.
+
+    Args:
+        category: Category to export
+        filename: Destination file; gzip-compressed if it ends in ".gz"
+        chunk_size: Number of rows formatted and written at a time
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with _open_text(filename, "w") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date", "Amount", "Description"])
+        for chunk in iter_ledger_chunks(category.ledger, chunk_size):
+            writer.writerows((ts, amount, desc) for amount, desc, ts in chunk)
+            count += len(chunk)
+    return count
+
+def write_jsonl(category: Category, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream a category's ledger to JSON Lines, one transaction per line.
+
+    Args:
+        category: Category to export
+        filename: Destination file; gzip-compressed if it ends in ".gz"
+        chunk_size: Number of rows formatted and written at a time
+
+    Returns:
+        Number of rows written
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    count = 0
+    with _open_text(filename, "w") as f:
+        for chunk in iter_ledger_chunks(category.ledger, chunk_size):
+            f.write("".join(
+                encode({"date": ts.isoformat(), "amount": amount, "description": desc}) + "\n"
+                for amount, desc, ts in chunk
+            ))
+            count += len(chunk)
+    return count
+
+# -------------------------
+# Readers
+# -------------------------
+
+def iter_csv_chunks(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Row]]:
+    """Yield rows of a CSV ledger export in chunks of at most `chunk_size`."""
+    parse_date = datetime.fromisoformat
+    with _open_text(filename, "r") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        if [col.lower() for col in header] != ["date", "amount", "description"]:
+            raise ValueError(f"Unexpected CSV header in {filename!r}: {header}")
+        rows = (row for row in reader if row)
+        while True:
+            chunk = [
+                (float(amount), desc, parse_date(date))
+                for date, amount, desc in islice(rows, chunk_size)
+            ]
+            if not chunk:
+                return
+            yield chunk
+
+def iter_jsonl_chunks(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Row]]:
+    """Yield rows of a JSON Lines ledger export in chunks of at most `chunk_size`."""
+    parse_date = datetime.fromisoformat
+    decode = json.JSONDecoder().decode
+    with _open_text(filename, "r") as f:
+        # Skip blank lines before chunking, so an all-blank window cannot
+        # look like the end of the file.
+        lines = (line for line in f if line.strip())
+        while True:
+            chunk = []
+            for line in islice(lines, chunk_size):
+                record = decode(line)
+                chunk.append((
+                    float(record["amount"]),
+                    record.get("description", ""),
+                    parse_date(record["date"]),
+                ))
+            if not chunk:
+                return
+            yield chunk
+
+def _load(chunks: Iterator[List[Row]], name: str, ledger: Optional[Ledger]) -> Category:
+    category = Category(name, ledger=ledger)
+    for chunk in chunks:
+        category.bulk_load(chunk, check_funds=False)
+    return category
+
+def read_csv(
+    filename: str,
+    name: Optional[str] = None,
+    ledger: Optional[Ledger] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Category:
+    """
+    Rebuild a category from a CSV ledger export.
+
+    Args:
+        filename: CSV file, optionally gzip-compressed (".gz")
+        name: Category name; defaults to the file's base name
+        ledger: Optional empty ledger backend, e.g. `ColumnarLedger()`
+        chunk_size: Number of rows parsed and loaded at a time
+
+    Returns:
+        Category whose ledger matches the exported transactions
+    """
+    return _load(iter_csv_chunks(filename, chunk_size), name or _category_name(filename), ledger)
+
+def read_jsonl(
+    filename: str,
+    name: Optional[str] = None,
+    ledger: Optional[Ledger] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Category:
+    """
+    Rebuild a category from a JSON Lines ledger export.
+
+    Args:
+        filename: JSONL file, optionally gzip-compressed (".gz")
+        name: Category name; defaults to the file's base name
+        ledger: Optional empty ledger backend, e.g. `ColumnarLedger()`
+        chunk_size: Number of rows parsed and loaded at a time
+
+    Returns:
+        Category whose ledger matches the exported transactions
+    """
+    return _load(iter_jsonl_chunks(filename, chunk_size), name or _category_name(filename), ledger)
+
+# -------------------------
+# Binary snapshots
+# -------------------------
+#
+# Layout (all little-endian):
+#
+#   header     magic, version, flags, category count, journal sequence,
+#              directory offset, string table offset
+#   records    fixed-width records, each category stored contiguously
+#              in ledger order: timestamp (epoch us), amount, running
+#              balance after the transaction, description string id
+#   directory  one entry per category: name string id, flags, first
+#              record index, record count, final balance
+#   strings    string count, (count + 1) byte offsets, UTF-8 blob
+#
+# Records and directory entries are fixed width, so a reader can mmap the
+# file and seek straight to any category or transaction.
+
+SNAPSHOT_MAGIC = b"BDGS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQQQQ")
+_RECORD = struct.Struct("<qddI4x")
+_ENTRY = struct.Struct("<IIQQd")
+_U64 = struct.Struct("<Q")
+_U64_SIGNED = struct.Struct("<q")
+
+_SORTED = 0x1  # Directory flag: records are in non-decreasing time order.
+
+def write_snapshot(
+    categories: Iterable[Category],
+    filename: str,
+    sequence: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    Write a binary snapshot of several categories.
+
+    Args:
+        categories: Categories to include; names must be unique
+        filename: Destination file
+        sequence: Journal sequence number the snapshot is consistent with
+        chunk_size: Number of records encoded and written at a time
+    """
+    string_ids: Dict[str, int] = {}
+    strings: List[str] = []
+
+    def intern(text: str) -> int:
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    directory = []
+    names = set()
+    record_index = 0
+    with open(filename, "wb") as f:
+        f.write(bytes(_HEADER.size))
+        for category in categories:
+            if category.name in names:
+                raise ValueError(f"Duplicate category name: {category.name!r}")
+            names.add(category.name)
+
+            ledger = category.ledger
+            if isinstance(ledger, ColumnarLedger):
+                # Read the columns directly; only the string table is remapped.
+                remap = [intern(text) for text in ledger.strings]
+                chunks = (
+                    zip(
+                        ledger.timestamps[i:i + chunk_size],
+                        ledger.amounts[i:i + chunk_size],
+                        [remap[d] for d in ledger.description_ids[i:i + chunk_size]],
+                    )
+                    for i in range(0, len(ledger), chunk_size)
+                )
+            else:
+                chunks = (
+                    [(_to_epoch_us(ts), amount, intern(desc)) for amount, desc, ts in chunk]
+                    for chunk in iter_ledger_chunks(ledger, chunk_size)
+                )
+
+            flags = _SORTED
+            balance = 0.0
+            last_ts = None
+            for chunk in chunks:
+                out = bytearray()
+                for epoch_us, amount, desc_id in chunk:
+                    if last_ts is not None and epoch_us < last_ts:
+                        flags &= ~_SORTED
+                    last_ts = epoch_us
+                    balance += amount
+                    out += _RECORD.pack(epoch_us, amount, balance, desc_id)
+                f.write(out)
+            directory.append((intern(category.name), flags, record_index, len(ledger), balance))
+            record_index += len(ledger)
+
+        directory_offset = f.tell()
+        f.write(b"".join(_ENTRY.pack(*entry) for entry in directory))
+
+        strings_offset = f.tell()
+        encoded = [text.encode("utf-8") for text in strings]
+        offsets = [0]
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+        f.write(_U64.pack(len(encoded)))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(b"".join(encoded))
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(directory),
+            sequence, directory_offset, strings_offset,
+        ))
+
+class Snapshot:
+    """
+    A read-only, memory-mapped view of a binary snapshot.
+
+    Opening a snapshot only reads its header and directory; balances are
+    available immediately and transactions are decoded on demand.
+
+    Example:
+        >>> with Snapshot("budget.snap") as snap:
+        ...     snap.balance("Food")
+        ...     food = snap.load("Food", ledger=ColumnarLedger())
+    """
+
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filename!r} is not a budget snapshot") from None
+
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{filename!r} is not a budget snapshot")
+        magic, version, _, count, sequence, directory_offset, strings_offset = (
+            _HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{filename!r} is not a budget snapshot")
+        if version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        self.sequence = sequence
+        string_count = _U64.unpack_from(self._mm, strings_offset)[0]
+        self._string_offsets = strings_offset + _U64.size
+        self._string_blob = self._string_offsets + (string_count + 1) * _U64.size
+        self._string_cache: Dict[int, str] = {}
+        self._directory: Dict[str, Tuple[int, int, int, float]] = {}
+        for i in range(count):
+            name_id, flags, first, length, balance = _ENTRY.unpack_from(
+                self._mm, directory_offset + i * _ENTRY.size
+            )
+            self._directory[self._string(name_id)] = (flags, first, length, balance)
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the snapshot and close the underlying file."""
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the categories stored in the snapshot."""
+        return list(self._directory)
+
+    def __len__(self) -> int:
+        return len(self._directory)
+
+    def count(self, name: str) -> int:
+        """Return the number of transactions stored for `name`."""
+        return self._directory[name][2]
+
+    def balance(self, name: str) -> float:
+        """Return the final balance of category `name`."""
+        return self._directory[name][3]
+
+    def balance_at(self, name: str, when: datetime) -> float:
+        """Return the balance of `name` including transactions up to `when`."""
+        flags, first, length, _ = self._directory[name]
+        epoch_us = _to_epoch_us(when)
+        if flags & _SORTED:
+            index = self._bisect(first, length, epoch_us)
+            if index == first:
+                return 0.0
+            return _RECORD.unpack_from(self._mm, self._record_offset(index - 1))[2]
+        balance = 0.0
+        for ts, amount, _, _ in self._iter_records(first, first + length):
+            if ts <= epoch_us:
+                balance += amount
+        return balance
+
+    def transactions(
+        self,
+        name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[Row]:
+        """
+        Yield `(amount, description, timestamp)` rows of `name` in ledger order.
+
+        Args:
+            name: Category name
+            start: Only include transactions at or after this time
+            end: Only include transactions before this time
+        """
+        flags, first, length, _ = self._directory[name]
+        lo, hi = first, first + length
+        start_us = _to_epoch_us(start) if start is not None else None
+        end_us = _to_epoch_us(end) if end is not None else None
+        if flags & _SORTED:
+            # Time-ordered records: narrow the scan with binary search.
+            if start_us is not None:
+                lo = self._bisect(first, length, start_us - 1)
+            if end_us is not None:
+                hi = self._bisect(first, length, end_us - 1)
+        for ts, amount, _, desc_id in self._iter_records(lo, hi):
+            if (start_us is None or ts >= start_us) and (end_us is None or ts < end_us):
+                yield amount, self._string(desc_id), _from_epoch_us(ts)
+
+    def load(self, name: str, ledger: Optional[Ledger] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Category:
+        """Rebuild category `name` from the snapshot."""
+        flags, first, length, _ = self._directory[name]
+        if isinstance(ledger, ColumnarLedger):
+            # Copy columns straight across without building datetimes.
+            string = self._string
+            for chunk in self._iter_record_chunks(first, first + length, chunk_size):
+                ledger.extend_epoch_rows(
+                    [record[1] for record in chunk],
+                    [string(record[3]) for record in chunk],
+                    [record[0] for record in chunk],
+                )
+            return Category(name, ledger=ledger)
+
+        category = Category(name, ledger=ledger)
+        rows = self.transactions(name)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return category
+            category.bulk_load(chunk, check_funds=False)
+
+    def load_all(self, columnar: bool = False) -> List[Category]:
+        """Rebuild every category, optionally using `ColumnarLedger` backends."""
+        return [
+            self.load(name, ledger=ColumnarLedger() if columnar else None)
+            for name in self._directory
+        ]
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _record_offset(self, index: int) -> int:
+        return _HEADER.size + index * _RECORD.size
+
+    def _iter_record_chunks(
+        self, lo: int, hi: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[Tuple[int, float, float, int]]]:
+        # Decode a bounded window at a time rather than the whole range.
+        for start in range(lo, hi, chunk_size):
+            begin = self._record_offset(start)
+            end = self._record_offset(min(start + chunk_size, hi))
+            yield list(_RECORD.iter_unpack(self._mm[begin:end]))
+
+    def _iter_records(self, lo: int, hi: int) -> Iterator[Tuple[int, float, float, int]]:
+        for chunk in self._iter_record_chunks(lo, hi):
+            yield from chunk
+
+    def _bisect(self, first: int, length: int, epoch_us: int) -> int:
+        """Return the index of the first record with timestamp > `epoch_us`."""
+        lo, hi = first, first + length
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _U64_SIGNED.unpack_from(self._mm, self._record_offset(mid))[0] <= epoch_us:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _string(self, string_id: int) -> str:
+        text = self._string_cache.get(string_id)
+        if text is None:
+            begin, end = struct.unpack_from("<2Q", self._mm, self._string_offsets + string_id * _U64.size)
+            text = self._mm[self._string_blob + begin:self._string_blob + end].decode("utf-8")
+            self._string_cache[string_id] = text
+        return text
@@ -0,0 +1,204 @@
+"""
+Budget Journal
+==============
+
+An append-only, group-committed journal of ledger changes. Each record
+is one JSON line holding a sequence number, the operation and the
+ledger entries it produced, so replaying the journal rebuilds every
+ledger exactly (timestamps included).
+
+Durability is controlled by the `sync` mode:
+    - "always": flush and fsync after every record
+    - "batch":  fsync once `batch_size` records are pending or
+                `flush_interval` seconds have passed (group commit)
+    - "none":   hand every record to the OS without fsync, so records
+                survive a process crash but not a power loss
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime
+import json
+import os
+import threading
+
+from budget import Transaction, _from_epoch_us, _to_epoch_us
+
+SYNC_MODES = ("always", "batch", "none")
+
+Entry = Tuple[str, float, str, int]  # (category, amount, description, epoch_us)
+
+class Journal:
+    """An append-only journal file with batched fsync."""
+
+    def __init__(
+        self,
+        filename: str,
+        sync: str = "batch",
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        sequence: Optional[int] = None,
+    ):
+        """
+        Args:
+            filename: Journal file, created if missing and appended to otherwise
+            sync: Durability mode, one of "always", "batch" or "none"
+            batch_size: Records per group commit in "batch" mode
+            flush_interval: Maximum seconds a record waits for fsync in "batch" mode
+            sequence: Last sequence number already used; read from the file
+                when omitted
+        """
+        if sync not in SYNC_MODES:
+            raise ValueError(f"sync must be one of {SYNC_MODES}, got {sync!r}")
+        self.filename = filename
+        self.sync = sync
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        if sequence is None:
+            records = read_journal(filename, repair=True)
+            sequence = max((record["seq"] for record in records), default=0)
+        self.sequence = sequence
+
+        self._lock = threading.Lock()
+        self._file = open(filename, "a", encoding="utf-8")
+        self._pending = 0
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if sync == "batch":
+            # Commit stragglers even when no further records arrive.
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, op: str, entries: Sequence[Entry] = (), **fields) -> int:
+        """
+        Append one record and return its sequence number.
+
+        Args:
+            op: Operation name, e.g. "deposit" or "transfer"
+            entries: Ledger entries produced by the operation
+            **fields: Extra JSON-serializable fields stored with the record
+        """
+        with self._lock:
+            self.sequence += 1
+            record = {"seq": self.sequence, "op": op, **fields, "entries": [list(e) for e in entries]}
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._pending += 1
+            if self.sync != "batch" or self._pending >= self.batch_size:
+                self._commit()
+            return self.sequence
+
+    def commit(self) -> None:
+        """Flush and fsync every pending record."""
+        with self._lock:
+            self._commit()
+
+    def truncate(self) -> None:
+        """
+        Discard every record, e.g. after a checkpoint captured them.
+
+        A "checkpoint" marker keeps the current sequence number in the
+        file, so reopening the journal never reuses sequence numbers.
+        """
+        with self._lock:
+            self._file.flush()
+            self._file.seek(0)
+            self._file.truncate()
+            marker = {"seq": self.sequence, "op": "checkpoint", "entries": []}
+            self._file.write(json.dumps(marker) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit pending records and close the file."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if not self._file.closed:
+                self._commit()
+                self._file.close()
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _commit(self) -> None:
+        if self._pending:
+            self._file.flush()
+            if self.sync != "none":
+                os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if not self._file.closed:
+                    self._commit()
+
+def entry(category: str, txn: Transaction) -> Entry:
+    """Describe a ledger transaction as a journal entry."""
+    return (category, txn.amount, txn.description, _to_epoch_us(txn.timestamp))
+
+def entry_row(e: Sequence) -> Tuple[float, str, datetime]:
+    """Convert a journal entry back into a `Category.bulk_load` row."""
+    _, amount, description, epoch_us = e
+    return amount, description, _from_epoch_us(epoch_us)
+
+def read_journal(filename: str, after: int = 0, repair: bool = False) -> Iterator[dict]:
+    """
+    Yield journal records with a sequence number greater than `after`.
+
+    A torn final line (from a crash mid-write) ends the journal. With
+    `repair`, the file is truncated to drop it so new records can be
+    appended cleanly.
+    """
+    if not os.path.exists(filename):
+        return
+    good_offset = 0
+    torn = False
+    with open(filename, "rb") as f:
+        for line in f:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete record")
+                record = json.loads(line)
+            except ValueError:
+                torn = True
+                break
+            good_offset += len(line)
+            if record["seq"] > after:
+                yield record
+    if torn and repair:
+        with open(filename, "r+b") as f:
+            f.truncate(good_offset)
+
+def records_to_rows(records: Iterator[dict]) -> Tuple[List[str], Dict[str, list], int]:
+    """
+    Group the entries of `records` into per-category `bulk_load` rows.
+
+    Returns:
+        The category names in order of first appearance (including ones
+        created by "add" records), a dict of name -> rows, and the last
+        sequence number seen (0 if there were no records).
+    """
+    names: List[str] = []
+    rows: Dict[str, list] = {}
+    last = 0
+    for record in records:
+        last = record["seq"]
+        if record["op"] == "add" and record["category"] not in rows:
+            names.append(record["category"])
+            rows[record["category"]] = []
+        for e in record["entries"]:
+            if e[0] not in rows:
+                names.append(e[0])
+                rows[e[0]] = []
+            rows[e[0]].append(entry_row(e))
+    return names, rows, last
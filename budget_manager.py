@@ -0,0 +1,266 @@
+"""
+Budget Manager
+==============
+
+A thread-safe layer over many `Category` objects. Every operation locks
+only the categories it touches, and locks are always taken in name
+order, so concurrent multi-category transfers cannot deadlock.
+
+With a `Journal` attached, every change is logged so that the budget can
+be rebuilt with `Budget.recover` after a crash; `Budget.checkpoint`
+compacts the journal into a binary snapshot.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from contextlib import contextmanager
+import asyncio
+import os
+import threading
+
+from budget import Category, ColumnarLedger
+from budget_io import Snapshot, write_snapshot
+from budget_journal import Entry, Journal, entry, read_journal, records_to_rows
+
+Transfer = Tuple[str, str, float]
+
+class Budget:
+    """A collection of categories supporting atomic concurrent transfers."""
+
+    def __init__(self, categories: Iterable[Category] = (), journal: Optional[Journal] = None):
+        """
+        Args:
+            categories: Initial categories; names must be unique
+            journal: Optional journal recording every change
+        """
+        self._categories: Dict[str, Category] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self.journal = journal
+        for category in categories:
+            self.add(category)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._categories
+
+    def __iter__(self) -> Iterator[Category]:
+        return iter(list(self._categories.values()))
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __getitem__(self, name: str) -> Category:
+        return self._categories[name]
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    def add(self, category: Category) -> Category:
+        """Register `category`; its name must be unique within the budget."""
+        with self._registry_lock:
+            if category.name in self._categories:
+                raise ValueError(f"Duplicate category name: {category.name!r}")
+            self._locks[category.name] = threading.Lock()
+            self._categories[category.name] = category
+            if self.journal is not None:
+                # Existing transactions are journaled so replay is complete.
+                self.journal.append(
+                    "add",
+                    [entry(category.name, txn) for txn in category.ledger],
+                    category=category.name,
+                )
+        return category
+
+    def deposit(self, name: str, amount: float, description: str = "") -> None:
+        """Record a deposit in category `name`."""
+        with self._locked([name]):
+            category = self._categories[name]
+            category.deposit(amount, description)
+            self._log("deposit", category)
+
+    def withdraw(self, name: str, amount: float, description: str = "") -> bool:
+        """Attempt to withdraw funds from category `name`."""
+        with self._locked([name]):
+            category = self._categories[name]
+            if category.withdraw(amount, description):
+                self._log("withdraw", category)
+                return True
+            return False
+
+    def transfer(self, source: str, destination: str, amount: float) -> bool:
+        """Atomically transfer `amount` from `source` to `destination`."""
+        with self._locked([source, destination]):
+            entries = self._transfer(source, destination, amount)
+            if entries is None:
+                return False
+            if self.journal is not None:
+                self.journal.append("transfer", entries)
+            return True
+
+    def transfer_many(self, transfers: Sequence[Transfer]) -> bool:
+        """
+        Apply several transfers as one all-or-nothing operation.
+
+        Args:
+            transfers: `(source, destination, amount)` tuples, applied in order
+
+        Returns:
+            True if every transfer was applied; False (with no changes made)
+            if any source would be overdrawn along the way
+        """
+        names = [name for source, destination, _ in transfers for name in (source, destination)]
+        with self._locked(names):
+            balances = {name: self._categories[name].get_balance() for name in names}
+            for source, destination, amount in transfers:
+                if balances[source] < amount:
+                    return False
+                balances[source] -= amount
+                balances[destination] += amount
+            entries: List[Entry] = []
+            for source, destination, amount in transfers:
+                entries += self._transfer(source, destination, amount)
+            # One record, so a crash can never persist only some of the legs.
+            if self.journal is not None:
+                self.journal.append("transfer_many", entries)
+            return True
+
+    def balance(self, name: str) -> float:
+        """Return the current balance of category `name`."""
+        with self._locked([name]):
+            return self._categories[name].get_balance()
+
+    def balances(self) -> Dict[str, float]:
+        """Return a consistent snapshot of every category's balance."""
+        categories = self._snapshot_categories()
+        with self._locked(categories):
+            return {name: c.get_balance() for name, c in categories.items()}
+
+    # -------------------------
+    # Durability
+    # -------------------------
+
+    def checkpoint(self, snapshot_filename: str) -> None:
+        """
+        Compact the journal into a binary snapshot.
+
+        The snapshot records the journal sequence it covers and replaces
+        `snapshot_filename` atomically, so a crash at any point leaves a
+        snapshot and journal that recover to the same state.
+        """
+        # Hold the registry lock throughout: a category added after the
+        # names were read would otherwise be covered by the sequence but
+        # missing from the snapshot.
+        with self._registry_lock, self._locked(self._categories):
+            sequence = 0
+            if self.journal is not None:
+                self.journal.commit()
+                sequence = self.journal.sequence
+            tmp = snapshot_filename + ".tmp"
+            write_snapshot(self._categories.values(), tmp, sequence=sequence)
+            with open(tmp, "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, snapshot_filename)
+            if self.journal is not None:
+                self.journal.truncate()
+
+    @classmethod
+    def recover(
+        cls,
+        snapshot_filename: str,
+        journal_filename: str,
+        columnar: bool = False,
+        **journal_options,
+    ) -> Budget:
+        """
+        Rebuild a budget from its last snapshot plus the journal.
+
+        Args:
+            snapshot_filename: Snapshot written by `checkpoint` (may not exist yet)
+            journal_filename: Journal file (may not exist yet)
+            columnar: Use `ColumnarLedger` backends for the rebuilt categories
+            **journal_options: Passed to `Journal` when reopening it for appends
+
+        Returns:
+            Budget with the journal reattached
+        """
+        categories: Dict[str, Category] = {}
+        sequence = 0
+        if os.path.exists(snapshot_filename):
+            with Snapshot(snapshot_filename) as snapshot:
+                sequence = snapshot.sequence
+                for category in snapshot.load_all(columnar=columnar):
+                    categories[category.name] = category
+
+        names, rows, last = records_to_rows(
+            read_journal(journal_filename, after=sequence, repair=True)
+        )
+        for name in names:
+            if name not in categories:
+                categories[name] = Category(name, ledger=ColumnarLedger() if columnar else None)
+            categories[name].bulk_load(rows[name], check_funds=False)
+
+        journal = Journal(journal_filename, sequence=max(last, sequence), **journal_options)
+        budget = cls(categories.values())
+        budget.journal = journal
+        return budget
+
+    # -------------------------
+    # asyncio interface
+    # -------------------------
+    #
+    # Each coroutine runs the blocking operation in a worker thread, so
+    # waiting for a lock never blocks the event loop.
+
+    async def adeposit(self, name: str, amount: float, description: str = "") -> None:
+        await asyncio.to_thread(self.deposit, name, amount, description)
+
+    async def awithdraw(self, name: str, amount: float, description: str = "") -> bool:
+        return await asyncio.to_thread(self.withdraw, name, amount, description)
+
+    async def atransfer(self, source: str, destination: str, amount: float) -> bool:
+        return await asyncio.to_thread(self.transfer, source, destination, amount)
+
+    async def atransfer_many(self, transfers: Sequence[Transfer]) -> bool:
+        return await asyncio.to_thread(self.transfer_many, transfers)
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _transfer(self, source: str, destination: str, amount: float) -> Optional[List[Entry]]:
+        """
+        Transfer between categories whose locks are already held.
+
+        Returns:
+            The journal entries of the transfer, or None if it was refused
+        """
+        src, dst = self._categories[source], self._categories[destination]
+        start = len(src.ledger)
+        if not src.transfer(amount, dst):
+            return None
+        return [entry(source, src.ledger[start]), entry(destination, dst.ledger[-1])]
+
+    def _snapshot_categories(self) -> Dict[str, Category]:
+        """Copy the registry so `add` can run while its locks are taken."""
+        with self._registry_lock:
+            return dict(self._categories)
+
+    def _log(self, op: str, category: Category) -> None:
+        """Journal the transaction just appended to `category`."""
+        if self.journal is not None:
+            self.journal.append(op, [entry(category.name, category.ledger[-1])])
+
+    @contextmanager
+    def _locked(self, names: Iterable[str]) -> Iterator[None]:
+        """Hold the locks of `names`, acquired in a global (sorted) order."""
+        locks: List[threading.Lock] = [self._locks[name] for name in sorted(set(names))]
+        acquired = 0
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired += 1
+            yield
+        finally:
+            for lock in reversed(locks[:acquired]):
+                lock.release()
@@ -1,19 +1,159 @@
+from collections.abc import Iterator
+from functools import reduce
+
 import numpy as np
 
+STATISTICS = ('mean', 'variance', 'standard deviation', 'max', 'min', 'sum')
+DEFAULT_CHUNK_BYTES = 16 * 2**20
+
 def calculate(list):
 
     if len(list) < 9:
         raise ValueError("List must contain nine numbers.")
 
     n_array = np.array(list).reshape(3, 3)
-    
+
+    # The overall statistics are merged from the columns' instead of read
+    # again; only the squared deviations need the data, since merging the
+    # columns' m2 would not give NumPy's variance to the last bit.
+    columns = _moments(n_array, 0)
+    merged = _merge_columns(columns)
+    merged['m2'] = np.sum(np.square(n_array - merged['mean']), keepdims=True)
+    by_column = _statistics(columns, (0,))
+    by_row = _statistics(_moments(n_array, 1), (1,))
+    overall = _statistics(merged, (0, 1))
+
     calculations = {
-        'mean': [np.mean(n_array, axis=0).tolist(), np.mean(n_array, axis=1).tolist(), np.mean(n_array).item()],
-        'variance': [np.var(n_array, axis=0).tolist(), np.var(n_array, axis=1).tolist(), np.var(n_array).item()],
-        'standard deviation': [np.std(n_array, axis=0).tolist(), np.std(n_array, axis=1).tolist(), np.std(n_array).item()],
-        'max': [np.max(n_array, axis=0).tolist(), np.max(n_array, axis=1).tolist(), np.max(n_array).item()],
-        'min': [np.min(n_array, axis=0).tolist(), np.min(n_array, axis=1).tolist(), np.min(n_array).item()],
-        'sum': [np.sum(n_array, axis=0).tolist(), np.sum(n_array, axis=1).tolist(), np.sum(n_array).item()]
+        name: [by_column[name].tolist(), by_row[name].tolist(), overall[name].item()]
+        for name in STATISTICS
+    }
+
+    return calculations
+
+def describe(data, axis=None, ddof=0, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Compute every statistic in `STATISTICS` in a single pass over `data`.
+
+    The data is read in chunks along its first axis. Each chunk is read
+    once, and the per-chunk moments are combined with Chan's parallel
+    form of Welford's update. Memory therefore stays bounded even for
+    memory-mapped arrays larger than RAM. An input that fits in one
+    chunk gives exactly NumPy's results.
+
+    Args:
+        data: An array (including `np.memmap`), the path of a `.npy` file
+            (opened memory-mapped), any other array-like (e.g. a list), or
+            an iterator (such as a generator) of array chunks to be stacked
+            along the first axis
+        axis: None, an int or a tuple of ints, as in `np.mean`
+        ddof: Delta degrees of freedom for variance and standard deviation
+        chunk_bytes: Approximate size of each chunk read from an array
+
+    Returns:
+        dict mapping each statistic name to an array (or a NumPy scalar
+        when reducing over every axis)
+    """
+    if isinstance(data, str):
+        data = np.load(data, mmap_mode='r')
+    state = _moments(data, axis, chunk_bytes)
+    return _statistics(state, state['axes'], ddof)
+
+def _moments(data, axis, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Read `data` once and return its merged moments (with keepdims shapes)."""
+    state = None
+    for chunk in _iter_chunks(data, chunk_bytes):
+        axes = _normalize_axis(axis, chunk.ndim)
+        moments = _chunk_moments(chunk, axes)
+        if state is None:
+            state = moments
+        elif 0 in axes:
+            state = _merge(state, moments)
+        else:
+            # Rows are independent: each chunk holds final values for its rows.
+            state = {
+                name: value if name == 'count' else np.concatenate([value, moments[name]])
+                for name, value in state.items()
+            }
+    if state is None:
+        raise ValueError("Cannot describe empty data.")
+    state['axes'] = axes
+    return state
+
+def _statistics(state, axes, ddof=0):
+    """Turn merged moments into the values of `STATISTICS`, reduced over `axes`."""
+    variance = state['m2'] / max(state['count'] - ddof, 0)
+    results = {
+        'mean': state['mean'],
+        'variance': variance,
+        'standard deviation': np.sqrt(variance),
+        'max': state['max'],
+        'min': state['min'],
+        'sum': state['sum'],
     }
+    return {name: np.squeeze(value, axis=axes)[()] for name, value in results.items()}
+
+def _iter_chunks(data, chunk_bytes):
+    if isinstance(data, Iterator):
+        for chunk in data:
+            yield np.asarray(chunk)
+        return
+    data = np.asarray(data)
+    if data.ndim == 0:
+        data = data.reshape(1)
+    if data.size == 0:
+        return
+    rows = max(1, chunk_bytes // max(1, data[:1].nbytes))
+    for start in range(0, len(data), rows):
+        yield data[start:start + rows]
+
+def _normalize_axis(axis, ndim):
+    if axis is None:
+        return tuple(range(ndim))
+    axes = (axis,) if np.ndim(axis) == 0 else tuple(axis)
+    if any(not -ndim <= a < ndim for a in axes):
+        raise ValueError(f"axis {axis} is out of bounds for data of dimension {ndim}")
+    return tuple(sorted({a % ndim for a in axes}))
 
-    return calculations
\ No newline at end of file
+def _chunk_moments(chunk, axes):
+    """Moments of one chunk, computed the way `np.mean`/`np.var` do."""
+    if chunk.dtype.kind in 'biu':
+        float_sum = np.sum(chunk, axis=axes, dtype=np.float64, keepdims=True)
+        total = np.sum(chunk, axis=axes, keepdims=True)
+    else:
+        total = float_sum = np.sum(chunk, axis=axes, keepdims=True)
+    count = int(np.prod([chunk.shape[a] for a in axes]))
+    mean = float_sum / count
+    deviations = chunk - mean
+    np.square(deviations, out=deviations)
+    return {
+        'count': count,
+        'mean': mean,
+        'm2': np.sum(deviations, axis=axes, keepdims=True),
+        'max': np.max(chunk, axis=axes, keepdims=True),
+        'min': np.min(chunk, axis=axes, keepdims=True),
+        'sum': total,
+    }
+
+def _merge_columns(state):
+    """Merge the per-column moments of a 2-D state into whole-array moments."""
+    columns = (
+        {name: value if name == 'count' else value[:, j:j + 1] for name, value in state.items() if name != 'axes'}
+        for j in range(state['mean'].shape[1])
+    )
+    merged = reduce(_merge, columns)
+    # The exact total gives the same mean as `np.mean`, unlike Chan's update.
+    merged['mean'] = merged['sum'] / merged['count']
+    return merged
+
+def _merge(a, b):
+    """Combine the moments of two chunks (Chan et al.)."""
+    count = a['count'] + b['count']
+    delta = b['mean'] - a['mean']
+    return {
+        'count': count,
+        'mean': a['mean'] + delta * (b['count'] / count),
+        'm2': a['m2'] + b['m2'] + delta ** 2 * (a['count'] * b['count'] / count),
+        'max': np.maximum(a['max'], b['max']),
+        'min': np.minimum(a['min'], b['min']),
+        'sum': a['sum'] + b['sum'],
+    }
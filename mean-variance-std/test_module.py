@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+import numpy as np
 import mean_var_std
 
 
@@ -17,5 +20,48 @@ class UnitTests(unittest.TestCase):
     def test_calculate_with_few_digits(self):
         self.assertRaisesRegex(ValueError, "List must contain nine numbers.", mean_var_std.calculate, [2,6,2,8,4,0,1,])
 
+    def test_calculate_matches_numpy(self):
+        rng = np.random.default_rng(2)
+        for values in (rng.integers(-50, 50, 9), rng.normal(0, 1e3, 9)):
+            actual = mean_var_std.calculate(values.tolist())
+            data = values.reshape(3, 3)
+            for name, reduce in (('mean', np.mean), ('variance', np.var), ('standard deviation', np.std), ('max', np.max), ('min', np.min), ('sum', np.sum)):
+                for position, axis in enumerate((0, 1, None)):
+                    np.testing.assert_allclose(actual[name][position], reduce(data, axis), rtol=1e-12, err_msg=f"{name} for axis={axis}")
+
+    def test_describe_matches_numpy(self):
+        data = np.arange(60).reshape(3, 4, 5) % 7
+        for axis in (None, 0, 2, (0, 2)):
+            actual = mean_var_std.describe(data, axis=axis)
+            expected = {'mean': np.mean(data, axis), 'variance': np.var(data, axis), 'standard deviation': np.std(data, axis), 'max': np.max(data, axis), 'min': np.min(data, axis), 'sum': np.sum(data, axis)}
+            for name in mean_var_std.STATISTICS:
+                np.testing.assert_array_equal(actual[name], expected[name], f"Expected NumPy's {name} for axis={axis}")
+
+    def test_describe_chunked(self):
+        data = np.random.default_rng(0).normal(10, 3, size=(1000, 4))
+        for axis in (None, 0, 1):
+            actual = mean_var_std.describe(data, axis=axis, ddof=1, chunk_bytes=256)
+            np.testing.assert_allclose(actual['mean'], np.mean(data, axis))
+            np.testing.assert_allclose(actual['variance'], np.var(data, axis, ddof=1))
+            np.testing.assert_allclose(actual['sum'], np.sum(data, axis))
+            np.testing.assert_array_equal(actual['max'], np.max(data, axis))
+
+    def test_describe_chunk_iterable_and_memmap(self):
+        data = np.random.default_rng(1).integers(0, 100, size=(500, 3))
+        actual = mean_var_std.describe(iter(np.array_split(data, 9)), axis=0)
+        np.testing.assert_allclose(actual['standard deviation'], np.std(data, axis=0))
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'data.npy')
+            np.save(filename, data)
+            actual = mean_var_std.describe(filename, chunk_bytes=100)
+        self.assertAlmostEqual(actual['variance'], np.var(data))
+        self.assertEqual(actual['sum'], np.sum(data))
+
+    def test_describe_list_input(self):
+        self.assertEqual(mean_var_std.describe([1, 2, 3])['mean'], 2.0)
+        actual = mean_var_std.describe([[1, 2], [3, 4]], axis=1)
+        np.testing.assert_array_equal(actual['sum'], [3, 7])
+        np.testing.assert_array_equal(actual['variance'], [0.25, 0.25])
+
 if __name__ == "__main__":
     unittest.main()
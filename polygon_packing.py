@@ -0,0 +1,212 @@
+"""
+polygon_packing.py
+
+Pack many item rectangles into a container `Rectangle`.
+
+Where `Rectangle.get_amount_inside` counts grid fits of a single shape,
+`pack` places a mix of items using one of three heuristics:
+    - "shelf":      rows of items, tallest first (fastest, least dense)
+    - "guillotine": recursive edge-to-edge cuts, best-area fit
+    - "maxrects":   maximal free rectangles, best-short-side fit (densest)
+
+Results are cached, so packing the same container and items again is free.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from polygon_shapes import Rectangle
+
+ALGORITHMS = ("shelf", "guillotine", "maxrects")
+PACK_CACHE_SIZE = 256
+
+Size = Tuple[int, int]  # (width, height)
+Free = Tuple[int, int, int, int]  # (x, y, width, height)
+
+class Placement(NamedTuple):
+    """Where one item was placed, measured from the container's corner."""
+    index: int  # position of the item in the input
+    x: int
+    y: int
+    width: int  # as placed, i.e. after any rotation
+    height: int
+    rotated: bool
+
+class PackingResult(NamedTuple):
+    placements: Tuple[Placement, ...]  # in input order
+    unplaced: Tuple[int, ...]  # input positions of items that did not fit
+    utilization: float  # placed area / container area
+
+def pack(
+    container: Rectangle,
+    items: Iterable[Rectangle],
+    algorithm: str = "maxrects",
+    rotate: bool = True,
+) -> PackingResult:
+    """
+    Place as many `items` as possible inside `container` without overlap.
+
+    Args:
+        container: The rectangle to fill
+        items: Rectangles (or squares) to place
+        algorithm: "shelf", "guillotine" or "maxrects"
+        rotate: Allow items to be turned by 90 degrees
+
+    Returns:
+        PackingResult with the placements, the items left over and the
+        fraction of the container's area that is covered
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+    sizes = tuple((item.width, item.height) for item in items)
+    if any(w <= 0 or h <= 0 for w, h in sizes):
+        raise ValueError("items must have positive width and height")
+    return _pack(container.width, container.height, sizes, algorithm, rotate)
+
+@lru_cache(maxsize=PACK_CACHE_SIZE)
+def _pack(width: int, height: int, sizes: Tuple[Size, ...], algorithm: str, rotate: bool) -> PackingResult:
+    if algorithm == "shelf":
+        placed = _shelf(width, height, sizes, rotate)
+    else:
+        # Large items first: they are the hardest to fit later.
+        order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][0] * sizes[i][1], -max(sizes[i])))
+        place = _guillotine if algorithm == "guillotine" else _maxrects
+        placed = place(width, height, sizes, order, rotate)
+
+    placed.sort()
+    done = {p.index for p in placed}
+    area = sum(p.width * p.height for p in placed)
+    return PackingResult(
+        tuple(placed),
+        tuple(i for i in range(len(sizes)) if i not in done),
+        area / (width * height) if width > 0 and height > 0 else 0.0,
+    )
+
+def _orientations(size: Size, rotate: bool) -> List[Tuple[int, int, bool]]:
+    w, h = size
+    if rotate and w != h:
+        return [(w, h, False), (h, w, True)]
+    return [(w, h, False)]
+
+# -------------------------
+# Shelf
+# -------------------------
+
+def _shelf(width: int, height: int, sizes: Tuple[Size, ...], rotate: bool) -> List[Placement]:
+    """First-fit decreasing-height shelves; with rotation, items lie on their long side."""
+    oriented = []
+    for i, (w, h) in enumerate(sizes):
+        turn = rotate and h > w and h <= width
+        oriented.append((h, w, turn, i) if turn else (w, h, False, i))
+    oriented.sort(key=lambda o: (-o[1], -o[0]))
+
+    shelves: List[List[int]] = []  # [y, shelf height, used width]
+    top = 0
+    placed = []
+    for w, h, turned, i in oriented:
+        for shelf in shelves:
+            y, shelf_height, used = shelf
+            fits = [(ow, oh, r) for ow, oh, r in _orientations((w, h), rotate) if oh <= shelf_height and used + ow <= width]
+            if fits:
+                ow, oh, r = min(fits, key=lambda f: shelf_height - f[1])
+                placed.append(Placement(i, used, y, ow, oh, turned != r))
+                shelf[2] += ow
+                break
+        else:
+            # Prefer the chosen orientation, but turn the item if that is
+            # the only way it fits on a new shelf.
+            fits = [(ow, oh, r) for ow, oh, r in _orientations((w, h), rotate) if ow <= width and top + oh <= height]
+            if fits:
+                ow, oh, r = fits[0]
+                shelves.append([top, oh, ow])
+                placed.append(Placement(i, 0, top, ow, oh, turned != r))
+                top += oh
+    return placed
+
+# -------------------------
+# Guillotine
+# -------------------------
+
+def _guillotine(width: int, height: int, sizes: Tuple[Size, ...], order: List[int], rotate: bool) -> List[Placement]:
+    """Best-area-fit guillotine packing, splitting along the shorter leftover axis."""
+    free: List[Free] = [(0, 0, width, height)]
+    placed = []
+    for i in order:
+        best: Optional[Tuple[Tuple[int, int], int, int, int, bool]] = None
+        for k, (fx, fy, fw, fh) in enumerate(free):
+            for w, h, r in _orientations(sizes[i], rotate):
+                if w <= fw and h <= fh:
+                    score = (fw * fh - w * h, min(fw - w, fh - h))
+                    if best is None or score < best[0]:
+                        best = (score, k, w, h, r)
+        if best is None:
+            continue
+        _, k, w, h, r = best
+        fx, fy, fw, fh = free.pop(k)
+        placed.append(Placement(i, fx, fy, w, h, r))
+        if fw - w < fh - h:
+            right, above = (fx + w, fy, fw - w, h), (fx, fy + h, fw, fh - h)
+        else:
+            right, above = (fx + w, fy, fw - w, fh), (fx, fy + h, w, fh - h)
+        free.extend(rect for rect in (right, above) if rect[2] > 0 and rect[3] > 0)
+    return placed
+
+# -------------------------
+# MaxRects
+# -------------------------
+
+def _maxrects(width: int, height: int, sizes: Tuple[Size, ...], order: List[int], rotate: bool) -> List[Placement]:
+    """MaxRects with the best-short-side-fit rule."""
+    free: List[Free] = [(0, 0, width, height)]
+    placed = []
+    for i in order:
+        best: Optional[Tuple[Tuple[int, int], int, int, int, int, bool]] = None
+        for fx, fy, fw, fh in free:
+            for w, h, r in _orientations(sizes[i], rotate):
+                if w <= fw and h <= fh:
+                    left_w, left_h = fw - w, fh - h
+                    score = (min(left_w, left_h), max(left_w, left_h))
+                    if best is None or score < best[0]:
+                        best = (score, fx, fy, w, h, r)
+        if best is None:
+            continue
+        _, x, y, w, h, r = best
+        placed.append(Placement(i, x, y, w, h, r))
+        free = _split_free(free, x, y, w, h)
+    return placed
+
+def _split_free(free: List[Free], x: int, y: int, w: int, h: int) -> List[Free]:
+    """Carve the placed rectangle out of every free rectangle it overlaps."""
+    kept: List[Free] = []
+    touching: List[Free] = []
+    new: List[Free] = []
+    for fx, fy, fw, fh in free:
+        if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+            kept.append((fx, fy, fw, fh))
+            if x <= fx + fw and fx <= x + w and y <= fy + fh and fy <= y + h:
+                touching.append((fx, fy, fw, fh))
+            continue
+        if x > fx:
+            new.append((fx, fy, x - fx, fh))
+        if x + w < fx + fw:
+            new.append((x + w, fy, fx + fw - x - w, fh))
+        if y > fy:
+            new.append((fx, fy, fw, y - fy))
+        if y + h < fy + fh:
+            new.append((fx, y + h, fw, fy + fh - y - h))
+
+    # Only the new rectangles can be redundant: untouched ones were
+    # already maximal. Each new one borders the placed rectangle, so any
+    # rectangle containing it must at least touch the placed one.
+    new = [rect for rect in dict.fromkeys(new) if rect not in touching]
+    for rect in new:
+        rx, ry, rw, rh = rect
+        if not any(
+            other != rect and ox <= rx and oy <= ry and rx + rw <= ox + ow and ry + rh <= oy + oh
+            for other in chain(touching, new)
+            for ox, oy, ow, oh in (other,)
+        ):
+            kept.append(rect)
+    return kept
@@ -2,20 +2,60 @@
 polygon_shapes.py
 
 A module for working with rectangles and squares using object-oriented programming.
+`RectangleArray` stores many shapes as NumPy arrays for vectorized work.
 """
 
 from __future__ import annotations  # for forward type hints (Python <3.11)
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only RectangleArray needs it.
+    np = None
+
+PICTURE_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=PICTURE_CACHE_SIZE)
+def _picture(width: int, height: int) -> str:
+    """Render (and cache) the '*' picture of a width x height rectangle."""
+    if width > 50 or height > 50:
+        return "Too big for picture."
+    return ("*" * width + "\n") * height
 
 class Rectangle:
     """
     A class representing a rectangle.
+
+    Instances use `__slots__` (no per-instance `__dict__`) and cache their
+    diagonal until a dimension changes.
     """
 
+    __slots__ = ("_width", "_height", "_diagonal")
+
     def __init__(self, width: int, height: int) -> None:
         """Initialize rectangle with width and height."""
         self.width = width
         self.height = height
 
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, width: int) -> None:
+        self._width = width
+        self._diagonal = None
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, height: int) -> None:
+        self._height = height
+        self._diagonal = None
+
     def __str__(self) -> str:
         return f"Rectangle(width={self.width}, height={self.height})"
     
@@ -27,29 +67,33 @@ class Rectangle:
 
     def get_area(self) -> int:
         """Return the area of the rectangle."""
-        return self.width * self.height
+        return self._width * self._height
     
     def get_perimeter(self) -> int:
         """Return the perimeter of the rectangle."""
-        return 2 * (self.width + self.height)
+        return 2 * (self._width + self._height)
     
     def get_diagonal(self) -> float:
         """Return the length of the diagonal."""
-        return (self.width ** 2 + self.height ** 2) ** 0.5
+        if self._diagonal is None:
+            self._diagonal = (self._width ** 2 + self._height ** 2) ** 0.5
+        return self._diagonal
     
     def get_picture(self) -> str:
         """Return a string representation of the rectangle using '*'."""
-        if self.width > 50 or self.height > 50:
-            return "Too big for picture."
-        return ("*" * self.width + "\n") * self.height
+        return _picture(self._width, self._height)
     
-    def get_amount_inside(self, other: Rectangle) -> int:
+    def get_amount_inside(self, other: Rectangle, rotate: bool = False) -> int:
         """
         Return the number of times `other` rectangle can fit inside this rectangle.
-        No rotation is considered.
+        No rotation is considered unless `rotate` is True, in which case the
+        better of the two grid orientations is counted. For mixed
+        orientations and different items, see `polygon_packing.pack`.
         """
-        times_width = self.width // other.width
-        times_height = self.height // other.height
+        times_width = self._width // other.width
+        times_height = self._height // other.height
+        if rotate:
+            return max(times_width * times_height, (self._width // other.height) * (self._height // other.width))
         return times_width * times_height
     
 class Square(Rectangle):
@@ -57,6 +101,8 @@ class Square(Rectangle):
     A class representing a square, subclass of Rectangle.
     """
 
+    __slots__ = ()
+
     def __init__(self, side: int) -> None:
         super().__init__(side, side)
 
@@ -75,6 +121,156 @@ class Square(Rectangle):
         self.set_side(height)
 
 
+# -------------------------
+# Vectorized collections
+# -------------------------
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("RectangleArray requires NumPy; install it with `pip install numpy`")
+
+class RectangleArray:
+    """
+    Many rectangles and squares stored as parallel NumPy arrays.
+
+    Indexing returns a view that behaves like a `Rectangle` (or `Square`)
+    but reads and writes the arrays directly; slicing returns a
+    `RectangleArray` sharing the same memory.
+    """
+
+    def __init__(self, widths, heights, squares=None) -> None:
+        """
+        Args:
+            widths: Widths, one per shape
+            heights: Heights, one per shape
+            squares: Optional booleans marking shapes that are squares
+        """
+        _require_numpy()
+        self.widths = np.asarray(widths, dtype=np.int64)
+        self.heights = np.asarray(heights, dtype=np.int64)
+        if self.widths.shape != self.heights.shape or self.widths.ndim != 1:
+            raise ValueError("widths and heights must be one-dimensional and of equal length")
+        if squares is None:
+            squares = np.zeros(len(self.widths), dtype=bool)
+        self.squares = np.asarray(squares, dtype=bool)
+        if self.squares.shape != self.widths.shape:
+            raise ValueError("squares must have one entry per shape")
+
+    @classmethod
+    def from_shapes(cls, shapes: Iterable[Rectangle]) -> RectangleArray:
+        """Copy the dimensions of existing `Rectangle`/`Square` objects."""
+        shapes = list(shapes)
+        return cls(
+            [shape.width for shape in shapes],
+            [shape.height for shape in shapes],
+            [isinstance(shape, Square) for shape in shapes],
+        )
+
+    def to_shapes(self) -> List[Rectangle]:
+        """Return independent `Rectangle`/`Square` objects for every shape."""
+        return [
+            Square(width) if square else Rectangle(width, height)
+            for width, height, square in zip(self.widths.tolist(), self.heights.tolist(), self.squares.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Rectangle, RectangleArray]:
+        if isinstance(index, slice):
+            return RectangleArray(self.widths[index], self.heights[index], self.squares[index])
+        index = range(len(self))[index]  # normalizes negatives and raises IndexError
+        return (SquareView if self.squares[index] else RectangleView)(self, index)
+
+    def __iter__(self) -> Iterator[Rectangle]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __str__(self) -> str:
+        return f"RectangleArray({len(self)} shapes)"
+
+    def get_area(self) -> "np.ndarray":
+        """Return the area of every shape."""
+        return self.widths * self.heights
+
+    def get_perimeter(self) -> "np.ndarray":
+        """Return the perimeter of every shape."""
+        return 2 * (self.widths + self.heights)
+
+    def get_diagonal(self) -> "np.ndarray":
+        """Return the diagonal length of every shape."""
+        return np.sqrt(self.widths.astype(np.float64) ** 2 + self.heights.astype(np.float64) ** 2)
+
+    def get_amount_inside(self, other: Union[Rectangle, RectangleArray], rotate: bool = False) -> "np.ndarray":
+        """
+        Return how many times `other` fits inside each shape.
+
+        `other` is either one shape, compared with every shape, or a
+        `RectangleArray` of the same length, compared element by element.
+        With `rotate`, the better of the two grid orientations is counted.
+        """
+        if isinstance(other, RectangleArray):
+            if len(other) != len(self):
+                raise ValueError("arrays must have the same length; use fit_counts for all pairs")
+            widths, heights = other.widths, other.heights
+        else:
+            widths, heights = other.width, other.height
+        if np.any(np.equal(widths, 0)) or np.any(np.equal(heights, 0)):
+            raise ZeroDivisionError("integer division or modulo by zero")
+        counts = (self.widths // widths) * (self.heights // heights)
+        if rotate:
+            counts = np.maximum(counts, (self.widths // heights) * (self.heights // widths))
+        return counts
+
+    def fit_counts(self, others: Union[RectangleArray, Iterable[Rectangle]]) -> "np.ndarray":
+        """
+        Return a matrix of how many times each of `others` fits inside each shape.
+
+        Entry `[i, j]` equals `self[i].get_amount_inside(others[j])`.
+        """
+        if not isinstance(others, RectangleArray):
+            others = RectangleArray.from_shapes(others)
+        if np.any(others.widths == 0) or np.any(others.heights == 0):
+            raise ZeroDivisionError("integer division or modulo by zero")
+        return (self.widths[:, None] // others.widths) * (self.heights[:, None] // others.heights)
+
+class RectangleView(Rectangle):
+    """A `Rectangle` whose dimensions live in a `RectangleArray`."""
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: RectangleArray, index: int) -> None:
+        self._array = array
+        self._index = index
+
+    # These shadow Rectangle's slots, so every inherited method and the
+    # width/height properties read and write the arrays.
+    @property
+    def _width(self) -> int:
+        return int(self._array.widths[self._index])
+
+    @_width.setter
+    def _width(self, width: int) -> None:
+        self._array.widths[self._index] = width
+
+    @property
+    def _height(self) -> int:
+        return int(self._array.heights[self._index])
+
+    @_height.setter
+    def _height(self, height: int) -> None:
+        self._array.heights[self._index] = height
+
+    def get_diagonal(self) -> float:
+        # Not cached: the arrays can change without going through this view.
+        return (self.width ** 2 + self.height ** 2) ** 0.5
+
+class SquareView(RectangleView, Square):
+    """A `Square` whose side lives in a `RectangleArray`."""
+
+    __slots__ = ()
+
+
 # Example usage (only runs when executed directly)
 if __name__ == "__main__":
     rect = Rectangle(10, 5)
@@ -0,0 +1,145 @@
+"""
+Polygon Shapes Benchmarks
+=========================
+
+Rough timings for the polygon shapes module. Run directly:
+
+    python polygon_shapes_benchmark.py
+"""
+
+import random
+import tracemalloc
+from time import perf_counter
+
+from polygon_packing import ALGORITHMS, pack
+from polygon_shapes import Rectangle, RectangleArray, Square
+
+
+def _shapes(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        Square(rng.randint(1, 100)) if rng.random() < 0.2 else Rectangle(rng.randint(1, 100), rng.randint(1, 100))
+        for _ in range(size)
+    ]
+
+
+class _LegacyRectangle:
+    """The dict-based Rectangle as it was before __slots__ and caching."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+
+    def get_diagonal(self) -> float:
+        return (self.width ** 2 + self.height ** 2) ** 0.5
+
+    def get_picture(self) -> str:
+        if self.width > 50 or self.height > 50:
+            return "Too big for picture."
+        return ("*" * self.width + "\n") * self.height
+
+
+def bench_memory(size: int = 1_000_000) -> None:
+    """Compare memory per object of the legacy and slotted classes."""
+    print("Object memory")
+    for label, cls in (("legacy", _LegacyRectangle), ("slots", Rectangle)):
+        tracemalloc.start()
+        shapes = [cls(i % 100 + 1, i % 37 + 1) for i in range(size)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del shapes
+        print(f"  {label:<7} | {size:,} objects | {current / size:6.1f} bytes/object")
+
+
+def bench_cached_values(shapes: int = 1_000, calls: int = 200) -> None:
+    """Compare repeated get_diagonal/get_picture calls on legacy and cached classes."""
+    print("Derived values")
+    for label, cls in (("legacy", _LegacyRectangle), ("cached", Rectangle)):
+        objects = [cls(i % 50 + 1, i % 23 + 1) for i in range(shapes)]
+        for method in ("get_diagonal", "get_picture"):
+            start = perf_counter()
+            for _ in range(calls):
+                for shape in objects:
+                    getattr(shape, method)()
+            elapsed = (perf_counter() - start) / (calls * shapes)
+            print(f"  {label:<7} | {method:<12} | {elapsed * 1e9:7.0f} ns/call")
+
+
+def bench_vectorized(sizes=(10_000, 100_000, 1_000_000)) -> None:
+    """Compare per-object method calls with RectangleArray operations."""
+    print("Shape metrics")
+    box = Rectangle(7, 3)
+    for size in sizes:
+        shapes = _shapes(size)
+        start = perf_counter()
+        array = RectangleArray.from_shapes(shapes)
+        convert = perf_counter() - start
+
+        start = perf_counter()
+        for shape in shapes:
+            shape.get_area()
+            shape.get_perimeter()
+            shape.get_diagonal()
+            shape.get_amount_inside(box)
+        looped = perf_counter() - start
+
+        start = perf_counter()
+        array.get_area()
+        array.get_perimeter()
+        array.get_diagonal()
+        array.get_amount_inside(box)
+        vectorized = perf_counter() - start
+
+        print(
+            f"  {size:>9,} shapes | objects {looped:7.3f}s | array {vectorized:7.4f}s "
+            f"| from_shapes {convert:6.3f}s | speedup {looped / vectorized:6.0f}x"
+        )
+
+
+def bench_fit_counts(containers: int = 2_000, items: int = 500) -> None:
+    """Compare pairwise fit counts with nested get_amount_inside calls."""
+    print("Pairwise fit counts")
+    outer, inner = _shapes(containers, seed=1), _shapes(items, seed=2)
+    start = perf_counter()
+    looped = [[a.get_amount_inside(b) for b in inner] for a in outer]
+    nested = perf_counter() - start
+
+    start = perf_counter()
+    counts = RectangleArray.from_shapes(outer).fit_counts(inner)
+    vectorized = perf_counter() - start
+    assert counts.tolist() == looped, "fit counts differ from get_amount_inside"
+    print(f"  {containers:,} x {items:,} pairs | loops {nested:7.3f}s | fit_counts {vectorized:7.4f}s")
+
+
+def bench_packing(items=(500, 2_000, 5_000)) -> None:
+    """Report packing time and density for each heuristic, plus cached repeats."""
+    print("Packing")
+    rng = random.Random(3)
+    container = Rectangle(1_000, 1_000)
+    for count in items:
+        boxes = [Rectangle(rng.randint(5, 40), rng.randint(5, 40)) for _ in range(count)]
+        for algorithm in ALGORITHMS:
+            start = perf_counter()
+            result = pack(container, boxes, algorithm)
+            elapsed = perf_counter() - start
+
+            start = perf_counter()
+            pack(container, boxes, algorithm)
+            cached = perf_counter() - start
+            print(
+                f"  {count:>5,} items | {algorithm:<10} | {elapsed:7.3f}s | cached {cached * 1e3:6.2f}ms "
+                f"| placed {len(result.placements):>5,} | utilization {result.utilization:6.1%}"
+            )
+
+    small, box = Rectangle(10, 7), Rectangle(3, 2)
+    grid = small.get_amount_inside(box)
+    packed = len(pack(small, [box] * (small.get_area() // box.get_area())).placements)
+    print(f"  {box} in {small} | grid fits {grid} | packed {packed}")
+
+
+if __name__ == "__main__":
+    bench_memory()
+    bench_cached_values()
+    bench_vectorized()
+    bench_fit_counts()
+    bench_packing()
@@ -0,0 +1,159 @@
+"""
+Probability Calculator Benchmarks
+=================================
+
+Rough timings for the probability calculator. Run directly:
+
+    python probability_benchmark.py
+"""
+
+import logging
+from time import perf_counter
+
+from probability_calculator import (
+    Hat,
+    exact_probability,
+    experiment,
+    experiment_adaptive,
+    experiment_many,
+    experiment_parallel,
+    experiment_vectorized,
+)
+
+logging.disable(logging.INFO)
+
+
+def bench_vectorized(trials=(10_000, 100_000, 1_000_000)) -> None:
+    """Compare the scalar and vectorized experiment engines."""
+    print("Monte Carlo engines")
+    hat = Hat(blue=5, red=4, green=2, yellow=6, black=3)
+    expected = {"red": 2, "green": 1}
+    for n in trials:
+        start = perf_counter()
+        fast = experiment_vectorized(hat, expected, 5, n, seed=1)
+        vectorized = perf_counter() - start
+
+        if n <= 100_000:
+            start = perf_counter()
+            slow = experiment(hat, expected, 5, n, seed=1)
+            scalar = f"{perf_counter() - start:8.3f}s (p={slow:.4f})"
+        else:
+            scalar = "skipped"
+
+        print(f"  {n:>9,} trials | vectorized {vectorized:7.3f}s (p={fast:.4f}) | scalar {scalar}")
+
+
+def bench_parallel(trials: int = 10_000_000, workers=(1, 2, 4)) -> None:
+    """Show scaling of the parallel runner and that results match across worker counts."""
+    print("Parallel runner")
+    hat = Hat(blue=5, red=4, green=2, yellow=6, black=3)
+    expected = {"red": 2, "green": 1}
+    baseline = None
+    for count in workers:
+        start = perf_counter()
+        p = experiment_parallel(hat, expected, 5, trials, seed=42, workers=count)
+        elapsed = perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"  {count} workers | {trials:,} trials | {elapsed:7.3f}s "
+            f"| speedup {baseline / elapsed:4.2f}x | p={p!r}"
+        )
+
+
+def bench_exact() -> None:
+    """Compare the exact solver with a 1M-trial Monte Carlo estimate."""
+    print("Exact solver")
+    cases = (
+        (Hat(blue=5, red=4, green=2, yellow=6, black=3), {"red": 2, "green": 1}, 5),
+        (Hat(red=300, blue=200, green=500), {"red": 20, "blue": 10, "green": 30}, 100),
+    )
+    for hat, expected, drawn in cases:
+        start = perf_counter()
+        exact = exact_probability(hat, expected, drawn)
+        solved = perf_counter() - start
+
+        start = perf_counter()
+        estimate = experiment_vectorized(hat, expected, drawn, 1_000_000, seed=1)
+        simulated = perf_counter() - start
+        print(
+            f"  {expected} in {drawn} | exact {exact:.6f} in {solved * 1e3:7.2f}ms "
+            f"| Monte Carlo {estimate:.6f} in {simulated * 1e3:7.2f}ms"
+        )
+
+
+def bench_adaptive(fixed_trials: int = 1_000_000, precision: float = 0.002) -> None:
+    """Compare adaptive early stopping with a fixed trial count."""
+    print(f"Adaptive experiments (precision +/-{precision})")
+    hat = Hat(blue=5, red=4, green=2, yellow=6, black=3)
+    queries = ({"red": 2, "green": 1}, {"blue": 1}, {"yellow": 3, "black": 1}, {"red": 4})
+    used = 0
+    for expected in queries:
+        result = experiment_adaptive(hat, expected, 5, precision=precision, seed=1)
+        exact = exact_probability(hat, expected, 5)
+        used += result.trials
+        print(
+            f"  {str(expected):<28} | p={result.estimate:.4f} "
+            f"[{result.low:.4f}, {result.high:.4f}] exact {exact:.4f} "
+            f"| {result.trials:>9,} trials in {result.elapsed * 1e3:6.1f}ms"
+        )
+    print(f"  average work vs {fixed_trials:,} fixed trials: {fixed_trials * len(queries) / used:.1f}x less")
+
+
+def bench_large_hats() -> None:
+    """Time hat construction, copying and drawing for large hats and many colors."""
+    print("Large hats")
+    cases = (
+        ("1M balls, 3 colors", {"red": 300_000, "blue": 500_000, "green": 200_000}),
+        ("10M balls, 3 colors", {"red": 3_000_000, "blue": 5_000_000, "green": 2_000_000}),
+        ("1M balls, 10k colors", {f"c{i}": 100 for i in range(10_000)}),
+    )
+    for label, balls in cases:
+        start = perf_counter()
+        hat = Hat(**balls)
+        built = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(1_000):
+            hat.copy()
+        copied = (perf_counter() - start) / 1_000
+
+        start = perf_counter()
+        hat.copy().draw(100_000)
+        drawn = perf_counter() - start
+        print(
+            f"  {label:<22} | build {built * 1e3:8.2f}ms | copy {copied * 1e6:8.1f}us "
+            f"| draw 100k {drawn * 1e3:7.1f}ms"
+        )
+
+
+def bench_many_queries(queries=(1, 10, 100, 1_000), trials: int = 100_000) -> None:
+    """Compare scoring many targets from one simulation with one simulation per target."""
+    print("Many-query batches")
+    hat = Hat(blue=5, red=4, green=2, yellow=6, black=3)
+    colors = list(hat.counts)
+    targets = [
+        {colors[i % 5]: 1 + i % 2, colors[(i // 5) % 5]: 1, colors[(i // 25) % 5]: i % 3}
+        for i in range(max(queries))
+    ]
+    for q in queries:
+        start = perf_counter()
+        experiment_many(hat, targets[:q], 5, trials, seed=1)
+        batched = perf_counter() - start
+
+        if q <= 100:
+            start = perf_counter()
+            for target in targets[:q]:
+                experiment_vectorized(hat, target, 5, trials, seed=1)
+            separate = f"{perf_counter() - start:7.3f}s"
+        else:
+            separate = "skipped"
+        print(f"  {q:>5,} queries | {trials:,} trials | batched {batched:7.3f}s | one by one {separate}")
+
+
+if __name__ == "__main__":
+    bench_vectorized()
+    bench_parallel()
+    bench_exact()
+    bench_adaptive()
+    bench_large_hats()
+    bench_many_queries()
@@ -1,13 +1,73 @@
-import copy
+from __future__ import annotations
+
 import random
 import logging
-from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
+from math import comb, exp, lgamma, sqrt
+from statistics import NormalDist
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized engine needs it.
+    np = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+DEFAULT_BATCH_SIZE = 100_000
+DEFAULT_MAX_STATES = 2_000_000
+MAX_COMPARISONS = 8_000_000  # cells compared at once by experiment_many
+
+class _FenwickTree:
+    """Binary indexed tree over non-negative counts, for weighted sampling."""
+
+    def __init__(self, values: List[int]) -> None:
+        self.size = len(values)
+        self.tree = [0] + list(values)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+        self.top = 1 << self.size.bit_length() if self.size else 0
+
+    def copy(self) -> _FenwickTree:
+        clone = _FenwickTree.__new__(_FenwickTree)
+        clone.size, clone.tree, clone.top = self.size, self.tree.copy(), self.top
+        return clone
+
+    def add(self, index: int, delta: int) -> None:
+        """Add `delta` to the value at `index`."""
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target: int) -> int:
+        """Return the first index whose running total exceeds `target`."""
+        pos = 0
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
 class Hat:
-    """Represents a hat containing colored balls."""
+    """
+    Represents a hat containing colored balls.
+
+    Balls are stored as one count per color, so memory and copy cost
+    depend on the number of colors rather than balls. Each draw picks a
+    color with probability proportional to its remaining count, using a
+    Fenwick tree to find it in O(log k) for k colors.
+    """
 
     def __init__(self, **balls: int) -> None:
         """
@@ -16,9 +76,48 @@ class Hat:
         Args:
             **balls: keyword arguments where key is ball color and value is count
         """
-        self.contents: List[str] = []
-        for color, count in balls.items():
-            self.contents.extend([color] * count)
+        self._set_counts(balls)
+
+    @property
+    def contents(self) -> List[str]:
+        """
+        One entry per ball, grouped by color in insertion order.
+
+        Cached (as an immutable tuple) until the next draw; each access
+        returns a fresh list. Assign a new list to replace the hat's
+        contents; mutating the returned list in place does not change
+        the hat.
+        """
+        if self._contents is None:
+            self._contents = tuple(
+                color for color, count in zip(self._colors, self._counts) for _ in range(count)
+            )
+        return list(self._contents)
+
+    @contents.setter
+    def contents(self, balls: List[str]) -> None:
+        self._set_counts(Counter(balls))
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of balls of each color currently in the hat."""
+        return dict(zip(self._colors, self._counts))
+
+    def __len__(self) -> int:
+        return self._total
+
+    def copy(self) -> Hat:
+        """Return an independent copy of the hat."""
+        clone = Hat.__new__(Hat)
+        clone._colors = self._colors
+        clone._counts = self._counts.copy()
+        clone._tree = self._tree.copy()
+        clone._total = self._total
+        clone._contents = self._contents
+        return clone
+
+    def __deepcopy__(self, memo: dict) -> Hat:
+        return self.copy()
 
     def draw(self, num_balls: int) -> List[str]:
         """
@@ -30,16 +129,45 @@ class Hat:
         Returns:
             List of drawn balls
         """
-        if num_balls >= len(self.contents):
-            drawn_balls = self.contents.copy()
-            self.contents.clear()
+        if num_balls >= self._total:
+            drawn_balls = self.contents
+            self._set_counts(dict.fromkeys(self._colors, 0))
             return drawn_balls
-        
-        drawn_balls = random.sample(self.contents, num_balls)
-        # Efficiently remove drawn balls
-        for ball in drawn_balls:
-            self.contents.remove(ball)
+
+        colors, counts, tree = self._colors, self._counts, self._tree
+        randbelow = random.randrange
+        total = self._total
+        drawn_balls = []
+        for _ in range(num_balls):
+            i = tree.find(randbelow(total))
+            tree.add(i, -1)
+            counts[i] -= 1
+            total -= 1
+            drawn_balls.append(colors[i])
+        self._total = total
+        self._contents = None
         return drawn_balls
+
+    def _set_counts(self, balls: Dict[str, int]) -> None:
+        self._colors: List[str] = list(balls)
+        self._counts: List[int] = [max(0, int(n)) for n in balls.values()]
+        self._tree = _FenwickTree(self._counts)
+        self._total = sum(self._counts)
+        self._contents: Optional[Tuple[str, ...]] = None
+
+    def probability(
+        self,
+        expected_balls: Dict[str, int],
+        num_balls_drawn: int,
+        **options,
+    ) -> float:
+        """
+        Return the probability of drawing at least `expected_balls`.
+
+        Exact when the problem is small enough, Monte Carlo otherwise;
+        see the module-level `probability` for the available options.
+        """
+        return probability(self, expected_balls, num_balls_drawn, **options)
     
 def experiment(
     hat: Hat,
@@ -69,12 +197,12 @@ def experiment(
     success_count = 0
 
     for _ in range(num_experiments):
-        temp_hat = copy.deepcopy(hat)
-        drawn_balls = temp_hat.draw(num_balls_drawn)
+        temp_hat = hat.copy()
+        drawn_balls = Counter(temp_hat.draw(num_balls_drawn))
 
         # Check if all expected balls are drawn
         success = all(
-            drawn_balls.count(color) >= count
+            drawn_balls[color] >= count
             for color, count in expected_balls.items()
         )
 
@@ -84,10 +212,489 @@ def experiment(
     return success_count / num_experiments
 
 
+# -------------------------
+# Vectorized engine
+# -------------------------
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("The vectorized engine requires NumPy (pip install numpy).")
+
+def _color_counts(hat: Hat) -> Dict[str, int]:
+    """Return the number of balls of each color in the hat."""
+    return hat.counts
+
+def _encode(hat: Hat, expected_balls: Dict[str, int]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encode a hat and a target as aligned count vectors.
+
+    Each expected color gets its own slot and every other color is pooled
+    into a final "other" slot, since only the expected counts matter.
+
+    Returns:
+        (counts, needed) integer arrays
+    """
+    counts = _color_counts(hat)
+    expected = [(color, n) for color, n in expected_balls.items() if n > 0]
+    slots = dict(expected)
+    others = sum(n for color, n in counts.items() if color not in slots)
+    hat_counts = np.array([counts.get(color, 0) for color, _ in expected] + [others], dtype=np.int64)
+    needed = np.array([n for _, n in expected] + [0], dtype=np.int64)
+    return hat_counts, needed
+
+def _count_successes(
+    counts: "np.ndarray",
+    needed: "np.ndarray",
+    num_balls_drawn: int,
+    num_trials: int,
+    rng: "np.random.Generator",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Simulate `num_trials` draws and count those meeting every requirement.
+
+    Each batch of trials is sampled at once from the multivariate
+    hypergeometric distribution, i.e. the per-color counts of drawing
+    without replacement.
+    """
+    total = int(counts.sum())
+    draws = min(num_balls_drawn, total)
+    if np.any(needed > counts) or needed.sum() > draws:
+        return 0
+    if not np.any(needed):
+        return num_trials
+
+    successes = 0
+    remaining = num_trials
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        drawn = rng.multivariate_hypergeometric(counts, draws, size=size)
+        successes += int(np.count_nonzero(np.all(drawn >= needed, axis=1)))
+        remaining -= size
+    return successes
+
+def experiment_vectorized(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    num_experiments: int,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> float:
+    """
+    NumPy-backed equivalent of `experiment`, running trials in batches.
+
+    Args:
+        hat: Hat object (left unchanged)
+        expected_balls: Dict of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls to draw in each experiment
+        num_experiments: Number of experiments to run
+        seed: Optional seed for a private NumPy generator; the global
+            `random` state is not touched
+        batch_size: Number of trials simulated per vectorized batch
+
+    Returns:
+        Estimated probability of success
+    """
+    _require_numpy()
+    counts, needed = _encode(hat, expected_balls)
+    rng = np.random.default_rng(seed)
+    successes = _count_successes(counts, needed, num_balls_drawn, num_experiments, rng, batch_size)
+    return successes / num_experiments
+
+def _encode_many(
+    hat: Hat, targets: Sequence[Dict[str, int]]
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encode a hat and several targets against one shared set of slots.
+
+    Every color named by any target gets a slot and the remaining colors
+    are pooled into a final "other" slot.
+
+    Returns:
+        (counts, needed) arrays of shape (colors,) and (targets, colors)
+    """
+    counts = _color_counts(hat)
+    colors = list(dict.fromkeys(color for target in targets for color, n in target.items() if n > 0))
+    slots = {color: i for i, color in enumerate(colors)}
+    others = sum(n for color, n in counts.items() if color not in slots)
+    hat_counts = np.array([counts.get(color, 0) for color in colors] + [others], dtype=np.int64)
+    needed = np.zeros((len(targets), len(colors) + 1), dtype=np.int64)
+    for row, target in enumerate(targets):
+        for color, n in target.items():
+            if n > 0:
+                needed[row, slots[color]] = n
+    return hat_counts, needed
+
+def experiment_many(
+    hat: Hat,
+    targets: Sequence[Dict[str, int]],
+    num_balls_drawn: int,
+    num_experiments: int,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[float]:
+    """
+    Estimate the probability of many targets from one shared simulation.
+
+    The draws are simulated once, and every batch of trials is scored
+    against all distinct targets with array comparisons, so the cost of
+    each extra target is a comparison rather than a new simulation.
+
+    Args:
+        hat: Hat object (left unchanged)
+        targets: Dicts of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls to draw in each experiment
+        num_experiments: Number of experiments to run
+        seed: Optional seed for a private NumPy generator
+        batch_size: Number of trials simulated per vectorized batch
+
+    Returns:
+        Estimated probability of success for each target, in order
+    """
+    _require_numpy()
+    if not targets:
+        return []
+    counts, needed = _encode_many(hat, targets)
+    # Identical targets are scored once and share their estimate.
+    needed, inverse = np.unique(needed, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    draws = min(num_balls_drawn, int(counts.sum()))
+    possible = np.all(needed <= counts, axis=1) & (needed.sum(axis=1) <= draws)
+    certain = ~np.any(needed, axis=1)
+    scored = np.flatnonzero(possible & ~certain)
+
+    successes = np.where(certain, num_experiments, 0).astype(np.int64)
+    rng = np.random.default_rng(seed)
+    remaining = num_experiments if len(scored) else 0
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        drawn = rng.multivariate_hypergeometric(counts, draws, size=size)
+        # Compare targets in blocks to bound the temporary boolean array.
+        block = max(1, MAX_COMPARISONS // (size * len(counts)))
+        for start in range(0, len(scored), block):
+            rows = scored[start:start + block]
+            met = np.all(drawn[:, None, :] >= needed[rows][None, :, :], axis=2)
+            successes[rows] += np.count_nonzero(met, axis=0)
+        remaining -= size
+    return (successes[inverse] / num_experiments).tolist()
+
+
+# -------------------------
+# Parallel runner
+# -------------------------
+
+def _run_chunk(
+    counts: "np.ndarray",
+    needed: "np.ndarray",
+    num_balls_drawn: int,
+    num_trials: int,
+    seed: "np.random.SeedSequence",
+) -> int:
+    """Worker entry point: count successes for one chunk of trials."""
+    rng = np.random.default_rng(seed)
+    return _count_successes(counts, needed, num_balls_drawn, num_trials, rng, num_trials)
+
+def experiment_parallel(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    num_experiments: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_BATCH_SIZE,
+) -> float:
+    """
+    Run a vectorized experiment across a pool of worker processes.
+
+    Trials are split into fixed-size chunks, and chunk `i` always draws
+    from the `i`-th stream spawned from `SeedSequence(seed)`. The result
+    therefore depends only on `seed` and `chunk_size`, never on the
+    number of workers or the order in which chunks finish.
+
+    Args:
+        hat: Hat object (left unchanged)
+        expected_balls: Dict of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls to draw in each experiment
+        num_experiments: Number of experiments to run
+        seed: Optional seed; None uses fresh OS entropy
+        workers: Number of processes; defaults to the CPU count. Use 1 to
+            run in the current process.
+        chunk_size: Trials per chunk (and per independent random stream)
+
+    Returns:
+        Estimated probability of success
+    """
+    _require_numpy()
+    counts, needed = _encode(hat, expected_balls)
+    sizes = [chunk_size] * (num_experiments // chunk_size)
+    if num_experiments % chunk_size:
+        sizes.append(num_experiments % chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = (
+        [counts] * len(sizes),
+        [needed] * len(sizes),
+        [num_balls_drawn] * len(sizes),
+        sizes,
+        streams,
+    )
+
+    if workers == 1 or len(sizes) <= 1:
+        successes = sum(map(_run_chunk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            successes = sum(pool.map(_run_chunk, *args))
+    return successes / num_experiments
+
+
+# -------------------------
+# Exact solver
+# -------------------------
+
+@lru_cache(maxsize=4096)
+def _binomial_row(n: int, upto: int) -> Tuple[int, ...]:
+    """Return C(n, j) for j = 0..upto."""
+    return tuple(comb(n, j) for j in range(upto + 1))
+
+@lru_cache(maxsize=4096)
+def _log_binomial_row(n: int, upto: int) -> Tuple[float, ...]:
+    """Return log C(n, j) for j = 0..upto."""
+    base = lgamma(n + 1)
+    return tuple(base - lgamma(j + 1) - lgamma(n - j + 1) for j in range(upto + 1))
+
+def _exact_states(counts: Dict[str, int], expected_balls: Dict[str, int], num_balls_drawn: int) -> int:
+    """Estimate the work done by `exact_probability` (DP cell updates)."""
+    n = min(num_balls_drawn, sum(counts.values()))
+    return sum(
+        (n + 1) * max(0, min(counts.get(color, 0), n) - k + 1)
+        for color, k in expected_balls.items()
+        if k > 0
+    )
+
+def _exact_fraction(counts: Dict[str, int], expected: Dict[str, int], n: int) -> Fraction:
+    """Exact probability as a rational, by counting favourable draws."""
+    # ways[t]: ways to pick t balls from the colors processed so far
+    # while meeting each one's minimum.
+    ways = [1] + [0] * n
+    for color, k in expected.items():
+        available = counts.get(color, 0)
+        row = _binomial_row(available, min(available, n))
+        new_ways = [0] * (n + 1)
+        for t, w in enumerate(ways):
+            if w:
+                for j in range(k, min(available, n - t) + 1):
+                    new_ways[t + j] += w * row[j]
+        ways = new_ways
+
+    total = sum(counts.values())
+    others = total - sum(counts.get(color, 0) for color in expected)
+    favourable = sum(w * comb(others, n - t) for t, w in enumerate(ways) if w)
+    return Fraction(favourable, comb(total, n))
+
+def _exact_float(counts: Dict[str, int], expected: Dict[str, int], n: int) -> float:
+    """Exact probability in floating point, using log-space binomials."""
+    total = sum(counts.values())
+    pool = total - sum(counts.get(color, 0) for color in expected)
+    # f[m]: probability that m draws from the colors handled so far
+    # (starting with the pooled unexpected colors) meet their minimums.
+    f = [1.0 if m <= pool else 0.0 for m in range(n + 1)]
+    for color, k in reversed(list(expected.items())):
+        available = counts.get(color, 0)
+        merged = pool + available
+        log_color = _log_binomial_row(available, min(available, n))
+        log_pool = _log_binomial_row(pool, min(pool, n))
+        log_merged = _log_binomial_row(merged, min(merged, n))
+        new_f = [0.0] * (n + 1)
+        for m in range(min(merged, n) + 1):
+            acc = 0.0
+            for j in range(max(k, m - pool), min(available, m) + 1):
+                if f[m - j]:
+                    acc += exp(log_color[j] + log_pool[m - j] - log_merged[m]) * f[m - j]
+            new_f[m] = acc
+        f, pool = new_f, merged
+    return min(1.0, f[n])
+
+def exact_probability(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    as_fraction: bool = False,
+) -> Union[float, Fraction]:
+    """
+    Compute the exact probability of drawing at least the expected balls.
+
+    The answer is a multivariate hypergeometric sum, evaluated by dynamic
+    programming over the expected colors; colors not in `expected_balls`
+    are pooled together. With `as_fraction` the favourable draws are
+    counted with integers, otherwise the conditional probabilities are
+    combined in floating point from log-space binomials, which stays fast
+    for very large hats (with relative error around 1e-8 once color
+    counts reach the millions).
+
+    Args:
+        hat: Hat object (left unchanged)
+        expected_balls: Dict of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls drawn
+        as_fraction: Return a `Fraction` instead of a float
+
+    Returns:
+        Probability of success
+    """
+    counts = _color_counts(hat)
+    n = min(num_balls_drawn, sum(counts.values()))
+    expected = {color: k for color, k in expected_balls.items() if k > 0}
+    if any(k > min(counts.get(color, 0), n) for color, k in expected.items()):
+        return Fraction(0) if as_fraction else 0.0
+    if as_fraction:
+        return _exact_fraction(counts, expected, n)
+    return _exact_float(counts, expected, n)
+
+def probability(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    max_states: int = DEFAULT_MAX_STATES,
+    num_experiments: int = 1_000_000,
+    seed: Optional[int] = None,
+) -> float:
+    """
+    Return the probability of drawing at least the expected balls.
+
+    Uses `exact_probability` unless its dynamic program would exceed
+    `max_states` cell updates, in which case it falls back to Monte Carlo
+    (the vectorized engine if NumPy is available, else `experiment`).
+
+    Args:
+        hat: Hat object (left unchanged)
+        expected_balls: Dict of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls drawn
+        max_states: Work limit for the exact solver
+        num_experiments: Trials for the Monte Carlo fallback
+        seed: Optional seed for the Monte Carlo fallback
+
+    Returns:
+        Probability (exact) or estimate (Monte Carlo) of success
+    """
+    if _exact_states(_color_counts(hat), expected_balls, num_balls_drawn) <= max_states:
+        return exact_probability(hat, expected_balls, num_balls_drawn)
+    if np is not None:
+        return experiment_vectorized(hat, expected_balls, num_balls_drawn, num_experiments, seed)
+    return experiment(hat, expected_balls, num_balls_drawn, num_experiments, seed)
+
+
+# -------------------------
+# Adaptive experiments
+# -------------------------
+
+class ExperimentResult(NamedTuple):
+    """Outcome of an adaptive experiment."""
+
+    estimate: float
+    low: float
+    high: float
+    trials: int
+    elapsed: float
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Return the Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+def _count_successes_scalar(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    num_trials: int,
+    rng: random.Random,
+) -> int:
+    """Pure-Python trial loop used when NumPy is unavailable."""
+    contents = hat.contents
+    draws = min(num_balls_drawn, len(contents))
+    expected = [(color, n) for color, n in expected_balls.items() if n > 0]
+    successes = 0
+    for _ in range(num_trials):
+        drawn = Counter(rng.sample(contents, draws))
+        if all(drawn[color] >= n for color, n in expected):
+            successes += 1
+    return successes
+
+def experiment_adaptive(
+    hat: Hat,
+    expected_balls: Dict[str, int],
+    num_balls_drawn: int,
+    precision: float = 0.005,
+    confidence: float = 0.95,
+    max_experiments: int = 10_000_000,
+    time_budget: Optional[float] = None,
+    batch_size: int = 10_000,
+    seed: Optional[int] = None,
+) -> ExperimentResult:
+    """
+    Run trials in batches until the estimate is precise enough.
+
+    After each batch a Wilson interval is computed; the run stops once
+    its half-width is at most `precision`, `time_budget` seconds have
+    elapsed, or `max_experiments` trials have been run. Batches are sized
+    from the current estimate so that they rarely overshoot the target.
+
+    Args:
+        hat: Hat object (left unchanged)
+        expected_balls: Dict of balls expected to draw {color: count}
+        num_balls_drawn: Number of balls to draw in each experiment
+        precision: Target half-width of the confidence interval
+        confidence: Confidence level of the interval
+        max_experiments: Hard cap on the number of trials
+        time_budget: Optional wall-clock limit in seconds
+        batch_size: Size of the first (and smallest) batch
+        seed: Optional seed for reproducibility
+
+    Returns:
+        ExperimentResult with the estimate, interval bounds, trials used
+        and elapsed seconds
+    """
+    start = perf_counter()
+    if np is not None:
+        counts, needed = _encode(hat, expected_balls)
+        rng = np.random.default_rng(seed)
+        def run(trials: int) -> int:
+            return _count_successes(counts, needed, num_balls_drawn, trials, rng)
+    else:
+        scalar_rng = random.Random(seed)
+        def run(trials: int) -> int:
+            return _count_successes_scalar(hat, expected_balls, num_balls_drawn, trials, scalar_rng)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    successes = trials = 0
+    low, high = 0.0, 1.0
+    while trials < max_experiments:
+        # Trials needed at the current (smoothed) estimate, reached by at
+        # most doubling each time so the time budget is checked often.
+        p = (successes + 1) / (trials + 2)
+        target = int(z * z * p * (1 - p) / (precision * precision)) + 1
+        size = min(max(target - trials, batch_size), max(trials, batch_size), max_experiments - trials)
+        successes += run(size)
+        trials += size
+        low, high = wilson_interval(successes, trials, confidence)
+        if (high - low) / 2 <= precision:
+            break
+        if time_budget is not None and perf_counter() - start >= time_budget:
+            break
+
+    estimate = successes / trials if trials else 0.0
+    return ExperimentResult(estimate, low, high, trials, perf_counter() - start)
+
+
 if __name__ == "__main__":
     # Example usage
     hat = Hat(red=3, blue=2, green=6)
-    probability = experiment(
+    estimate = experiment(
         hat,
         expected_balls={"red": 2, "green": 1},
         num_balls_drawn=4,
@@ -98,6 +705,10 @@ if __name__ == "__main__":
     logging.info("Hat contents: %s", hat.contents)
     logging.info(
         "Estimated probability of drawing 2 red and 1 green in 4 draws: %.2f",
-        probability,
+        estimate,
+    )
+    logging.info(
+        "Exact probability: %s",
+        exact_probability(hat, {"red": 2, "green": 1}, 4, as_fraction=True),
     )
 
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from budget import Category, ColumnarLedger
+import budget_io
+
+
+def rows(category):
+    return [(t.amount, t.description, t.timestamp) for t in category.ledger]
+
+
+class RoundTripTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.category = Category("food")
+        start = datetime(2024, 1, 1, 9, 30)
+        self.category.bulk_load(
+            [(100.0, "initial", start)]
+            + [(-1.25 * i, f"item, \"{i}\"", start + timedelta(hours=i)) for i in range(1, 8)],
+            check_funds=False,
+        )
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_round_trip(self):
+        formats = {".csv": (budget_io.write_csv, budget_io.read_csv), ".jsonl": (budget_io.write_jsonl, budget_io.read_jsonl)}
+        for ext, (write, read) in formats.items():
+            for suffix in (ext, ext + ".gz"):
+                for ledger in (None, ColumnarLedger()):
+                    with self.subTest(suffix=suffix, columnar=ledger is not None):
+                        filename = self.path("food" + suffix)
+                        self.assertEqual(write(self.category, filename, chunk_size=3), 8)
+                        loaded = read(filename, ledger=ledger, chunk_size=3)
+                        self.assertEqual(loaded.name, "food")
+                        self.assertEqual(rows(loaded), rows(self.category))
+                        self.assertEqual(loaded.get_balance(), self.category.get_balance())
+
+    def test_blank_lines_do_not_end_the_file(self):
+        formats = {".csv": (budget_io.write_csv, budget_io.iter_csv_chunks), ".jsonl": (budget_io.write_jsonl, budget_io.iter_jsonl_chunks)}
+        for suffix, (write, iter_chunks) in formats.items():
+            with self.subTest(suffix=suffix):
+                filename = self.path("food" + suffix)
+                write(self.category, filename)
+                with open(filename) as f:
+                    lines = f.readlines()
+                with open(filename, "w") as f:
+                    f.writelines(lines[:2] + ["\n", "\n"] + lines[2:])
+                chunks = list(iter_chunks(filename, chunk_size=1))
+                self.assertEqual([row for chunk in chunks for row in chunk], rows(self.category))
+
+
+if __name__ == "__main__":
+    unittest.main()
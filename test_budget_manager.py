@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from budget import Category
+from budget_journal import Journal, read_journal
+from budget_manager import Budget
+
+
+class RecoveryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.journal_file = os.path.join(self.tmp.name, "budget.journal")
+        self.snapshot_file = os.path.join(self.tmp.name, "budget.snapshot")
+        self.budget = Budget(journal=Journal(self.journal_file, sync="always"))
+        for name in ("food", "rent", "fun"):
+            self.budget.add(Category(name))
+        self.budget.deposit("food", 100, "initial")
+        self.budget.deposit("rent", 50, "initial")
+
+    def recover(self, budget=None):
+        (budget or self.budget).journal.close()
+        budget = Budget.recover(self.snapshot_file, self.journal_file)
+        self.addCleanup(budget.journal.close)
+        return budget
+
+    def tear_last_record(self):
+        with open(self.journal_file, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.truncate(size - 5)
+
+    def test_torn_final_record_is_dropped(self):
+        self.budget.withdraw("food", 30, "groceries")
+        self.budget.withdraw("food", 10, "snacks")
+        self.budget.journal.close()
+        self.tear_last_record()
+        budget = self.recover()
+        self.assertEqual(budget.balances(), {"food": 70, "rent": 50, "fun": 0})
+        budget.deposit("fun", 5)
+        self.assertEqual(self.recover(budget).balances(), {"food": 70, "rent": 50, "fun": 5})
+
+    def test_crash_between_snapshot_replace_and_truncate(self):
+        self.budget.transfer("food", "fun", 25)
+        with mock.patch.object(Journal, "truncate"):
+            self.budget.checkpoint(self.snapshot_file)
+        self.budget.withdraw("rent", 20, "deposit")
+        expected = self.budget.balances()
+        budget = self.recover()
+        self.assertEqual(budget.balances(), expected)
+        self.assertEqual(len(budget["food"].ledger), 2)
+        self.assertEqual(len(budget["rent"].ledger), 2)
+
+    def test_transfer_many_is_replayed_whole(self):
+        self.assertTrue(self.budget.transfer_many([("food", "fun", 40), ("rent", "food", 10)]))
+        expected = self.budget.balances()
+        budget = self.recover()
+        self.assertEqual(budget.balances(), expected)
+
+    def test_torn_transfer_many_loses_every_leg(self):
+        before = self.budget.balances()
+        self.budget.transfer_many([("food", "fun", 40), ("rent", "food", 10)])
+        self.budget.journal.close()
+        self.tear_last_record()
+        budget = self.recover()
+        self.assertEqual(budget.balances(), before)
+
+
+class JournalTests(unittest.TestCase):
+    def test_unsynced_records_reach_the_os_immediately(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "budget.journal")
+            with Journal(filename, sync="none") as journal:
+                journal.append("deposit", [("food", 1.0, "", 0)])
+                self.assertEqual([r["seq"] for r in read_journal(filename)], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
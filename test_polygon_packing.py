@@ -0,0 +1,60 @@
+import random
+import unittest
+from polygon_packing import ALGORITHMS, pack
+from polygon_shapes import Rectangle, Square
+
+
+class PackTests(unittest.TestCase):
+    def assertValidPacking(self, container, items, result, rotate):
+        placed = {p.index for p in result.placements}
+        self.assertEqual(placed | set(result.unplaced), set(range(len(items))))
+        self.assertFalse(placed & set(result.unplaced))
+        for p in result.placements:
+            w, h = items[p.index].width, items[p.index].height
+            self.assertEqual((p.width, p.height), (h, w) if p.rotated else (w, h))
+            if not rotate:
+                self.assertFalse(p.rotated)
+            self.assertTrue(0 <= p.x and p.x + p.width <= container.width, p)
+            self.assertTrue(0 <= p.y and p.y + p.height <= container.height, p)
+        for a in result.placements:
+            for b in result.placements:
+                if a.index < b.index:
+                    overlap = (a.x < b.x + b.width and b.x < a.x + a.width
+                               and a.y < b.y + b.height and b.y < a.y + a.height)
+                    self.assertFalse(overlap, f"{a} overlaps {b}")
+        area = sum(p.width * p.height for p in result.placements)
+        self.assertAlmostEqual(result.utilization, area / container.get_area())
+
+    def test_random_items_are_placed_validly(self):
+        rng = random.Random(7)
+        for trial in range(20):
+            container = Rectangle(rng.randint(20, 60), rng.randint(20, 60))
+            items = [
+                Square(rng.randint(1, 12)) if rng.random() < 0.2 else Rectangle(rng.randint(1, 25), rng.randint(1, 25))
+                for _ in range(rng.randint(1, 40))
+            ]
+            for algorithm in ALGORITHMS:
+                for rotate in (True, False):
+                    with self.subTest(trial=trial, algorithm=algorithm, rotate=rotate):
+                        result = pack(container, items, algorithm, rotate)
+                        self.assertValidPacking(container, items, result, rotate)
+
+    def test_item_that_only_fits_rotated(self):
+        container, items = Rectangle(10, 100), [Rectangle(20, 5), Rectangle(30, 4)]
+        for algorithm in ALGORITHMS:
+            with self.subTest(algorithm=algorithm):
+                result = pack(container, items, algorithm)
+                self.assertEqual(result.unplaced, ())
+                self.assertTrue(all(p.rotated for p in result.placements))
+                self.assertValidPacking(container, items, result, rotate=True)
+                self.assertEqual(pack(container, items, algorithm, rotate=False).unplaced, (0, 1))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            pack(Rectangle(10, 10), [Rectangle(1, 1)], "bogus")
+        with self.assertRaises(ValueError):
+            pack(Rectangle(10, 10), [Rectangle(0, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
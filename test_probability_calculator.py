@@ -0,0 +1,37 @@
+import unittest
+import probability_calculator
+from probability_calculator import Hat
+
+
+class EngineTests(unittest.TestCase):
+    def test_zero_count_target_keeps_color_in_hat(self):
+        hat = Hat(red=3, blue=2, green=6)
+        expected = {'red': 2, 'green': 0}
+        exact = probability_calculator.exact_probability(hat, expected, 4)
+        self.assertAlmostEqual(exact, probability_calculator.exact_probability(hat, {'red': 2}, 4))
+        estimates = {
+            'experiment': probability_calculator.experiment(hat, expected, 4, 20_000, seed=1),
+            'vectorized': probability_calculator.experiment_vectorized(hat, expected, 4, 200_000, seed=1),
+            'parallel': probability_calculator.experiment_parallel(hat, expected, 4, 200_000, seed=1, workers=1),
+            'adaptive': probability_calculator.experiment_adaptive(hat, expected, 4, seed=1).estimate,
+            'many': probability_calculator.experiment_many(hat, [expected], 4, 200_000, seed=1)[0],
+            'fallback': probability_calculator.probability(hat, expected, 4, max_states=0, num_experiments=200_000, seed=1),
+        }
+        for engine, estimate in estimates.items():
+            self.assertAlmostEqual(estimate, exact, delta=0.02, msg=f"{engine} disagrees with the exact answer")
+
+
+class HatTests(unittest.TestCase):
+    def test_contents_is_a_fresh_list(self):
+        hat = Hat(red=2, blue=1)
+        hat.contents.append('green')
+        clone = hat.copy()
+        clone.contents.clear()
+        self.assertEqual(hat.contents, ['red', 'red', 'blue'])
+        self.assertEqual(clone.contents, ['red', 'red', 'blue'])
+        self.assertEqual(len(clone.draw(3)), 3)
+        self.assertEqual(hat.contents, ['red', 'red', 'blue'])
+
+
+if __name__ == "__main__":
+    unittest.main()
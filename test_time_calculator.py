@@ -0,0 +1,147 @@
+import contextlib
+import io
+import threading
+import unittest
+import zoneinfo
+from datetime import date, datetime, time, timedelta, timezone
+import time_calculator
+from time_calculator import add_duration, add_time, format_days_passed, iter_record_chunks, stream_add_time
+
+
+def stream(text, **kwargs):
+    sink, errors = io.StringIO(), io.StringIO()
+    counts = stream_add_time(io.StringIO(text), sink, errors=errors, **kwargs)
+    return sink.getvalue().splitlines(), errors.getvalue().splitlines(), counts
+
+
+class StreamTests(unittest.TestCase):
+    CSV = (
+        "start,duration,day\n"
+        "3:00 PM,3:10\n"
+        "bad\n"
+        "11:30 AM,2:32,Monday\n"
+        "\n"
+        "10:10 PM,x:30\n"
+        "11:43 PM,24:20,someday\n"
+        "6:30 PM,205:12,saturDAY\n"
+    )
+
+    def test_output_lines_align_with_rows(self):
+        output, errors, counts = stream(self.CSV, chunk_size=2)
+        self.assertEqual(output, [
+            add_time("3:00 PM", "3:10"),
+            "",
+            add_time("11:30 AM", "2:32", "Monday"),
+            "",
+            "",
+            add_time("6:30 PM", "205:12", "saturDAY"),
+        ])
+        self.assertEqual(counts, (3, 3))
+        self.assertEqual([e.split(":")[0] for e in errors], ["line 3", "line 6", "line 7"])
+        self.assertIn("someday", errors[2])
+
+    def test_jsonl_line_numbers(self):
+        text = '{"start": "3:00 PM", "duration": "3:10"}\n\nnope\n{"start": "1:00 AM", "duration": "1"}\n'
+        output, errors, counts = stream(text, fmt="jsonl")
+        self.assertEqual(output, ["6:10 PM", "", ""])
+        self.assertEqual([e.split(":")[0] for e in errors], ["line 3", "line 4"])
+        self.assertEqual(counts, (1, 2))
+
+    def test_workers_keep_input_order(self):
+        rows = [f"{1 + i % 12}:{i % 60:02d} {'AM' if i % 2 else 'PM'},{i % 50}:{i % 60:02d}" for i in range(500)]
+        for i in range(7, 500, 37):
+            rows[i] = "bad,row"
+        text = "\n".join(rows) + "\n"
+        expected = stream(text, chunk_size=16)
+        self.assertEqual(stream(text, chunk_size=16, workers=3), expected)
+        self.assertEqual(len(expected[0]), 500)
+
+    def test_problems_count_toward_chunk_size(self):
+        text = "bad\n" * 10 + "3:00 PM,3:10\n"
+        chunks = list(iter_record_chunks(io.StringIO(text), chunk_size=4))
+        self.assertTrue(all(len(records) + len(problems) <= 4 for records, problems in chunks))
+        self.assertEqual(sum(len(problems) for _, problems in chunks), 10)
+
+    def test_main_runs_demo_without_input(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(time_calculator.main([]), 0)
+        self.assertIn("6:10 PM", out.getvalue())
+
+
+def reference(start, seconds, on, tz, calendar_days=False):
+    """add_duration computed directly with zoneinfo (fold=0)."""
+    zone = zoneinfo.ZoneInfo(tz)
+    hour, minute = divmod(time_calculator._start_minutes(start), 60)
+    local = datetime.combine(on, time(hour, minute), tzinfo=zone)
+    if calendar_days:
+        end = (local + timedelta(seconds=seconds)).astimezone(timezone.utc).astimezone(zone)
+    else:
+        end = (local.astimezone(timezone.utc) + timedelta(seconds=seconds)).astimezone(zone)
+    clock = time_calculator.TIME_STRINGS[end.hour * 60 + end.minute]
+    result = f"{clock} {end.tzname()}, {end.strftime('%A')} {end.date().isoformat()}"
+    days_passed = format_days_passed((end.date() - on).days)
+    return f"{result} {days_passed}" if days_passed else result
+
+
+class ZoneTests(unittest.TestCase):
+    ZONES = {
+        "America/New_York": (date(2024, 3, 10), date(2024, 11, 3)),
+        "Europe/London": (date(2024, 3, 31), date(2024, 10, 27)),
+        "Australia/Lord_Howe": (date(2024, 10, 6), date(2024, 4, 7)),  # 30-minute shifts
+    }
+    STARTS = ("12:00 AM", "12:45 AM", "1:00 AM", "1:30 AM", "1:59 AM", "2:00 AM", "2:30 AM", "3:00 AM", "11:30 PM")
+
+    def check(self, tz, on, start, duration, unit="minutes"):
+        seconds = duration * time_calculator.DURATION_UNITS[unit]
+        expected = reference(start, seconds, on, tz, calendar_days=unit == "days")
+        self.assertEqual(add_duration(start, duration, on=on, tz=tz, unit=unit), expected,
+                         f"{start} + {duration} {unit} on {on} in {tz}")
+
+    def test_dst_gap(self):
+        for tz, (gap, _) in self.ZONES.items():
+            for on in (gap - timedelta(days=1), gap):
+                for start in self.STARTS:
+                    for duration in (0, 30, 60, 90, 24 * 60):
+                        self.check(tz, on, start, duration)
+                    self.check(tz, on, start, 1, unit="days")
+
+    def test_dst_overlap(self):
+        for tz, (_, overlap) in self.ZONES.items():
+            for on in (overlap - timedelta(days=1), overlap):
+                for start in self.STARTS:
+                    for duration in (0, 30, 60, 90, 24 * 60):
+                        self.check(tz, on, start, duration)
+                    self.check(tz, on, start, 1, unit="days")
+
+    def test_table_extends_backwards(self):
+        table = time_calculator._ZoneTable(zoneinfo.ZoneInfo("Europe/London"))
+        for year in (2024, 1990, 2030):
+            utc = int(datetime(year, 7, 1, tzinfo=timezone.utc).timestamp())
+            self.assertEqual(table.to_local(utc), (utc + 3600, "BST"))
+
+    def test_concurrent_extension_stays_consistent(self):
+        table = time_calculator._ZoneTable(zoneinfo.ZoneInfo("America/New_York"))
+        barrier = threading.Barrier(8)
+        failures = []
+
+        def work(offset):
+            barrier.wait()
+            for year in range(2000 + offset, 2000 + offset + 24, 3):
+                utc = int(datetime(year, 1, 15, 12, tzinfo=timezone.utc).timestamp())
+                if table.to_local(utc) != (utc - 5 * 3600, "EST"):
+                    failures.append(year)
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        snapshot = table._table
+        self.assertEqual(len(set(snapshot.utc)), len(snapshot.utc))
+        self.assertEqual(snapshot.utc, sorted(snapshot.utc))
+        self.assertEqual(len(snapshot.utc), 2 * (snapshot.last_year - snapshot.first_year + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
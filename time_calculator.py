@@ -1,6 +1,45 @@
 """Time Calculator"""
 
-from typing import Optional, Tuple, Union
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple, Union
+import argparse
+import csv
+import gzip
+import json
+import sys
+import threading
+import zoneinfo
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; add_time_many falls back to lists.
+    np = None
+
+MINUTES_PER_DAY = 24 * 60
+PARSE_CACHE_SIZE = 4096
+DEFAULT_CHUNK_SIZE = 10_000
+INPUT_FORMATS = ("csv", "jsonl")
+DURATION_UNITS = {"minutes": 60, "hours": 3600, "days": 86400}  # seconds per unit
+
+DAY_NUMBERS = {
+    "sunday": 1,
+    "monday": 2,
+    "tuesday": 3,
+    "wednesday": 4,
+    "thursday": 5,
+    "friday": 6,
+    "saturday": 7,
+}
+DAY_NAMES = {number: name for name, number in DAY_NUMBERS.items()}
+
+Minutes = Union[Sequence[str], Sequence[int], "np.ndarray"]
+Record = Tuple[int, str, str, Optional[str]]  # (line number, start, duration, day)
+Problem = Tuple[int, str]  # (line number, message)
+Chunk = Tuple[List[Record], List[Problem]]
 
 def day_of_week_convert(
     day_name: Optional[str] = None,
@@ -18,19 +57,9 @@ def day_of_week_convert(
             - If given a number, returns corresponding day string.
             - None if not found.
     """
-    days = {
-        "sunday": 1,
-        "monday": 2,
-        "tuesday": 3,
-        "wednesday": 4,
-        "thursday": 5,
-        "friday": 6,
-        "saturday": 7,
-    }
-
     if day_name:
-        return days.get(day_name.strip().lower())
-    return next((k for k, v in days.items() if v == day_number), None)
+        return DAY_NUMBERS.get(day_name.strip().lower())
+    return DAY_NAMES.get(day_number)
 
 def parse_time_12h(start: str) -> Tuple[int, int, str]:
     """Split a 12h formatted time string into hour, minute, and AM/PM."""
@@ -59,6 +88,22 @@ def minutes_to_12h(total_minutes: int) -> Tuple[int, int, str]:
         return 12, new_minute, "PM"
     return new_hour_24 - 12, new_minute, "PM"
 
+# "h:mm AM/PM" for every minute of the day, indexed by minutes since midnight.
+TIME_STRINGS = tuple(
+    "{}:{:02d} {}".format(*minutes_to_12h(minute)) for minute in range(MINUTES_PER_DAY)
+)
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _start_minutes(start: str) -> int:
+    """Parse a 12h start time into minutes since midnight (cached)."""
+    return convert_to_minutes(*parse_time_12h(start))
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _duration_minutes(duration: str) -> int:
+    """Parse an "hours:minutes" duration into minutes (cached)."""
+    hours, minutes = map(int, duration.split(":"))
+    return hours * 60 + minutes
+
 def format_days_passed(days_passed: int) -> str:
     """Return a string describing how many days have passed."""
     if days_passed == 0:
@@ -71,8 +116,7 @@ def calculate_new_day(start_day: str, days_passed: int) -> str:
     """Return the new day of week after adding days_passed."""
     start_day_number = day_of_week_convert(day_name=start_day)
     new_day_number = ((start_day_number - 1) + days_passed) % 7 + 1
-    new_day_name = day_of_week_convert(day_number=new_day_number)
-    return new_day_name.title()
+    return DAY_NAMES[new_day_number].title()
 
 def add_time(start: str, duration: str, day_of_week: Optional[str] = None) -> str:
     """
@@ -86,17 +130,9 @@ def add_time(start: str, duration: str, day_of_week: Optional[str] = None) -> st
     Returns:
         str: New time string with day and days passed if applicable.
     """
-    start_hour, start_minute, am_pm = parse_time_12h(start)
-    start_total_minutes = convert_to_minutes(start_hour, start_minute, am_pm)
-
-    duration_hour, duration_minute = map(int, duration.split(":"))
-    duration_total_minutes = duration_hour * 60 + duration_minute
-
-    total_minutes = start_total_minutes + duration_total_minutes
-    days_passed = total_minutes // (24 * 60)
-
-    new_hour, new_minute, new_am_pm = minutes_to_12h(total_minutes)
-    new_time_string = f"{new_hour}:{new_minute:02d} {new_am_pm}"
+    total_minutes = _start_minutes(start) + _duration_minutes(duration)
+    days_passed = total_minutes // MINUTES_PER_DAY
+    new_time_string = TIME_STRINGS[total_minutes % MINUTES_PER_DAY]
 
     days_passed_string = format_days_passed(days_passed)
     new_day_string = (
@@ -115,10 +151,543 @@ def add_time(start: str, duration: str, day_of_week: Optional[str] = None) -> st
     if len(parts) == 2:
         return f"{parts[0]}, {parts[1]}"
     return f"{parts[0]}, {parts[1]} {parts[2]}"
-    
 
-if __name__ == "__main__":
-    # Demo runs
+# -------------------------
+# Batch API
+# -------------------------
+
+def _parse_durations(durations: Sequence[str]) -> List[int]:
+    """Convert "hours:minutes" durations into minutes, exactly as `add_time` does."""
+    return list(map(_duration_minutes, durations))
+
+def _parse_starts(starts: Sequence[str]) -> List[int]:
+    """Convert 12h start times into minutes since midnight."""
+    return list(map(_start_minutes, starts))
+
+def _as_minutes(values: Minutes, parse) -> Sequence[int]:
+    """Return `values` as minute counts, parsing them if they are strings."""
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return values.astype(np.int64)
+    if len(values) and isinstance(values[0], str):
+        return parse(values)
+    return list(values)
+
+def _start_day_numbers(days: Sequence[Optional[str]]) -> List[int]:
+    """Map weekday names to 0 (Sunday) .. 6 (Saturday), or -1 for no day."""
+    cache: Dict[Optional[str], int] = {}
+    numbers = []
+    for day in days:
+        number = cache.get(day)
+        if number is None:
+            if not day:
+                number = -1
+            else:
+                found = day_of_week_convert(day_name=day)
+                if found is None:
+                    raise ValueError(f"Unknown day of week: {day!r}")
+                number = found - 1
+            cache[day] = number
+        numbers.append(number)
+    return numbers
+
+def add_time_many(
+    starts: Minutes,
+    durations: Minutes,
+    days_of_week: Optional[Sequence[Optional[str]]] = None,
+) -> List[str]:
+    """
+    Add many durations to many start times at once.
+
+    Results are identical to calling `add_time` on each row. Parsing is
+    done in bulk, the minute and weekday arithmetic runs as vectorized
+    integer operations when NumPy is installed, and times of day come
+    from `TIME_STRINGS`.
+
+    Args:
+        starts: 12h start times (e.g. "3:30 PM") or minutes since midnight.
+        durations: Durations as "hours:minutes" strings or in minutes.
+        days_of_week (optional): Starting day names; None entries (or
+            omitting the argument) leave the day out of the result.
+
+    Returns:
+        list[str]: New time strings in input order.
+    """
+    start_minutes = _as_minutes(starts, _parse_starts)
+    duration_minutes = _as_minutes(durations, _parse_durations)
+    if len(start_minutes) != len(duration_minutes):
+        raise ValueError("starts and durations must have the same length")
+    if days_of_week is not None and len(days_of_week) != len(start_minutes):
+        raise ValueError("days_of_week must have the same length as starts")
+
+    if np is not None:
+        totals = np.asarray(start_minutes, dtype=np.int64) + np.asarray(duration_minutes, dtype=np.int64)
+        days_passed, minute_of_day = np.divmod(totals, MINUTES_PER_DAY)
+        if days_of_week is not None:
+            day_numbers = np.array(_start_day_numbers(days_of_week), dtype=np.int64)
+            new_days = np.where(day_numbers < 0, -1, (day_numbers + days_passed) % 7).tolist()
+        days_passed, minute_of_day = days_passed.tolist(), minute_of_day.tolist()
+    else:
+        totals = [a + b for a, b in zip(start_minutes, duration_minutes)]
+        days_passed = [total // MINUTES_PER_DAY for total in totals]
+        minute_of_day = [total % MINUTES_PER_DAY for total in totals]
+        if days_of_week is not None:
+            new_days = [
+                -1 if day < 0 else (day + passed) % 7
+                for day, passed in zip(_start_day_numbers(days_of_week), days_passed)
+            ]
+
+    times = TIME_STRINGS
+    suffixes: Dict[int, str] = {}
+
+    def passed(days: int) -> str:
+        suffix = suffixes.get(days)
+        if suffix is None:
+            suffix = suffixes[days] = format_days_passed(days)
+        return suffix
+
+    if days_of_week is None:
+        return [
+            times[minute] if not days else f"{times[minute]}, {passed(days)}"
+            for minute, days in zip(minute_of_day, days_passed)
+        ]
+
+    names = [DAY_NAMES[n].title() for n in range(1, 8)]
+    results = []
+    for minute, days, day in zip(minute_of_day, days_passed, new_days):
+        if day < 0:
+            results.append(times[minute] if not days else f"{times[minute]}, {passed(days)}")
+        elif not days:
+            results.append(f"{times[minute]}, {names[day]}")
+        else:
+            results.append(f"{times[minute]}, {names[day]} {passed(days)}")
+    return results
+
+# -------------------------
+# Calendar and timezone engine
+# -------------------------
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+Transition = Tuple[int, int, Tuple[int, str]]  # (utc instant, offset before, (offset, name) after)
+
+class _Transitions(NamedTuple):
+    """An immutable snapshot of a zone's transitions over whole years."""
+    first_year: int
+    last_year: int
+    initial: Tuple[int, str]  # (offset, name) before the first transition
+    utc: List[int]     # transition instants, seconds since the epoch
+    wall: List[int]    # the same instants on the pre-transition wall clock
+    before: List[int]  # offset in effect before each transition
+    after: List[Tuple[int, str]]  # (offset, name) from each transition on
+
+class _ZoneTable:
+    """
+    UTC offset transitions of one timezone, built lazily a year at a time.
+
+    Offsets are probed once per day and each change is located to the
+    second by bisection, so changes less than a day apart are not seen.
+    After that, converting an instant is a `bisect` over plain lists
+    instead of a zoneinfo call.
+
+    Tables are shared between threads: extending one builds new lists
+    under a lock and publishes them in a single assignment, so readers
+    always see columns that agree with each other.
+    """
+
+    def __init__(self, zone: zoneinfo.ZoneInfo) -> None:
+        self.zone = zone
+        self._lock = threading.Lock()
+        self._table: Optional[_Transitions] = None
+
+    def to_local(self, utc: int) -> Tuple[int, str]:
+        """Return (local seconds since the epoch, zone abbreviation) for a UTC instant."""
+        table = self._cover(utc)
+        i = bisect_right(table.utc, utc) - 1
+        offset, name = table.after[i] if i >= 0 else table.initial
+        return utc + offset, name
+
+    def to_utc(self, local: int) -> int:
+        """
+        Return the UTC instant of a local wall-clock time.
+
+        Like zoneinfo with fold=0, ambiguous times resolve to the earlier
+        offset and nonexistent times (in a DST gap) to the offset in
+        effect before the gap.
+        """
+        self._cover(local - _SECONDS_PER_DAY)
+        table = self._cover(local + _SECONDS_PER_DAY)
+        i = bisect_right(table.wall, local) - 1
+        if i < 0:
+            return local - table.initial[0]
+        if local - table.after[i][0] < table.utc[i]:
+            return local - table.before[i]
+        return local - table.after[i][0]
+
+    def _cover(self, utc: int) -> _Transitions:
+        """Return the current table, first extending it to the year of `utc`."""
+        year = _year_of(utc)
+        table = self._table
+        if table is not None and table.first_year <= year <= table.last_year:
+            return table
+        with self._lock:
+            table = self._table
+            if table is None:
+                first = last = year
+                initial = self._probe(_year_start(year))
+                transitions = self._find(year)
+            else:
+                first, last, initial = table.first_year, table.last_year, table.initial
+                transitions = list(zip(table.utc, table.before, table.after))
+            while year < first:
+                first -= 1
+                initial = self._probe(_year_start(first))
+                transitions[:0] = self._find(first)
+            while year > last:
+                last += 1
+                transitions += self._find(last)
+            table = self._table = _Transitions(
+                first,
+                last,
+                initial,
+                [at for at, _, _ in transitions],
+                [at + before for at, before, _ in transitions],
+                [before for _, before, _ in transitions],
+                [after for _, _, after in transitions],
+            )
+            return table
+
+    def _find(self, year: int) -> List[Transition]:
+        """Locate every transition after 1 January of `year` up to and including 1 January of the next."""
+        transitions = []
+        lo = _year_start(year)
+        current = self._probe(lo)
+        end = _year_start(year + 1)
+        while lo < end:
+            hi = min(lo + _SECONDS_PER_DAY, end)
+            state = self._probe(hi)
+            if state != current:
+                a, b = lo, hi
+                while b - a > 1:
+                    mid = (a + b) // 2
+                    if self._probe(mid) == current:
+                        a = mid
+                    else:
+                        b = mid
+                transitions.append((b, current[0], state))
+                current = state
+            lo = hi
+        return transitions
+
+    def _probe(self, utc: int) -> Tuple[int, str]:
+        moment = datetime.fromtimestamp(utc, tz=timezone.utc).astimezone(self.zone)
+        return int(moment.utcoffset().total_seconds()), moment.tzname()
+
+def _year_of(seconds: int) -> int:
+    return date.fromordinal(_EPOCH_ORDINAL + seconds // _SECONDS_PER_DAY).year
+
+def _year_start(year: int) -> int:
+    return (date(year, 1, 1).toordinal() - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+
+@lru_cache(maxsize=None)
+def _zone_table(key: str) -> _ZoneTable:
+    """Return the shared transition table for the zone named `key`."""
+    return _ZoneTable(zoneinfo.ZoneInfo(key))
+
+def _duration_seconds(duration: Union[str, int, float], unit: str) -> int:
+    """Convert an "hours:minutes" string or a number of `unit`s into whole seconds."""
+    if isinstance(duration, str):
+        return _duration_minutes(duration) * 60
+    if unit not in DURATION_UNITS:
+        raise ValueError(f"unit must be one of {tuple(DURATION_UNITS)}, got {unit!r}")
+    seconds = round(duration * DURATION_UNITS[unit])
+    if seconds % 60:
+        raise ValueError(f"duration must be a whole number of minutes, got {duration!r} {unit}")
+    return seconds
+
+def add_duration(
+    start: str,
+    duration: Union[str, int, float],
+    day_of_week: Optional[str] = None,
+    on: Optional[date] = None,
+    tz: Optional[str] = None,
+    unit: str = "minutes",
+) -> str:
+    """
+    Add a duration to a 12h start time, optionally on a real date in a timezone.
+
+    Without `on`, the result is exactly what `add_time` returns for the
+    same duration. With `on`, the start is that local date and time and
+    the result names the real weekday and date, e.g.
+    "3:30 AM EDT, Sunday 2024-03-10 (next day)".
+
+    Minutes and hours are elapsed time, so crossing a DST change moves
+    the wall clock by an extra hour either way. Days are calendar days:
+    the wall-clock time is kept, then resolved like zoneinfo's fold=0.
+
+    Args:
+        start (str): Start time, e.g. "3:30 PM".
+        duration (str or number): "hours:minutes", or a count of `unit`.
+        day_of_week (str, optional): Starting day; ignored when `on` is given.
+        on (date, optional): Starting date.
+        tz (str, optional): IANA timezone name, e.g. "America/New_York";
+            without it dates are treated as UTC.
+        unit (str): "minutes", "hours" or "days" for numeric durations.
+
+    Returns:
+        str: New time string.
+    """
+    return add_duration_many([start], [duration], [day_of_week], None if on is None else [on], tz, unit)[0]
+
+def add_duration_many(
+    starts: Sequence[str],
+    durations: Sequence[Union[str, int, float]],
+    days_of_week: Optional[Sequence[Optional[str]]] = None,
+    dates: Optional[Sequence[date]] = None,
+    tz: Optional[str] = None,
+    unit: str = "minutes",
+) -> List[str]:
+    """
+    Batch form of `add_duration`.
+
+    The zone's transition table is built once and shared by every row
+    (and every later call), so each conversion is a list bisection.
+
+    Returns:
+        list[str]: New time strings in input order.
+    """
+    if dates is None:
+        minutes = [_duration_seconds(d, unit) // 60 for d in durations]
+        return add_time_many(starts, minutes, days_of_week)
+    if len(dates) != len(starts) or len(durations) != len(starts):
+        raise ValueError("starts, durations and dates must have the same length")
+
+    table = _zone_table(tz) if tz else None
+    results = []
+    for start, duration, day in zip(starts, durations, dates):
+        seconds = _duration_seconds(duration, unit)
+        start_day = day.toordinal() - _EPOCH_ORDINAL
+        local = start_day * _SECONDS_PER_DAY + _start_minutes(start) * 60
+        name = ""
+        if table is None:
+            local += seconds
+        elif unit == "days" and not isinstance(duration, str):
+            local, name = table.to_local(table.to_utc(local + seconds))
+        else:
+            local, name = table.to_local(table.to_utc(local) + seconds)
+
+        days, second = divmod(local, _SECONDS_PER_DAY)
+        time_string = TIME_STRINGS[second // 60]
+        if name:
+            time_string = f"{time_string} {name}"
+        new_date = date.fromordinal(_EPOCH_ORDINAL + days)
+        parts = [time_string, f"{DAY_NAMES[(days + 4) % 7 + 1].title()} {new_date.isoformat()}"]
+        days_passed = format_days_passed(days - start_day)
+        results.append(f"{parts[0]}, {parts[1]} {days_passed}" if days_passed else ", ".join(parts))
+    return results
+
+# -------------------------
+# Streaming pipeline
+# -------------------------
+
+def _csv_record(line: int, row: List[str]) -> Record:
+    if len(row) not in (2, 3):
+        raise ValueError(f"expected start,duration[,day] but got {len(row)} fields")
+    start, duration, *day = row
+    return line, start, duration.strip(), day[0] if day else None
+
+def _jsonl_record(line: int, text: str) -> Record:
+    try:
+        obj = json.loads(text)
+    except ValueError as exc:
+        raise ValueError(f"invalid JSON: {exc}") from None
+    if not isinstance(obj, dict) or not {"start", "duration"} <= obj.keys():
+        raise ValueError('expected an object with "start" and "duration"')
+    fields = (obj["start"], obj["duration"], obj.get("day"))
+    if not all(isinstance(field, str) for field in fields[:2]) or not isinstance(fields[2], (str, type(None))):
+        raise ValueError("start, duration and day must be strings")
+    return (line,) + fields
+
+def iter_record_chunks(
+    source: TextIO,
+    fmt: str = "csv",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Chunk]:
+    """
+    Read (start, duration, day) records in chunks of at most `chunk_size`.
+
+    CSV rows hold `start,duration[,day]` with an optional header row;
+    JSONL lines hold objects with "start", "duration" and optional "day"
+    keys. Blank lines are skipped. Rows that cannot be read are returned
+    as problems alongside the records of their chunk, and count toward
+    its size.
+
+    Args:
+        source: Text stream to read
+        fmt: "csv" or "jsonl"
+        chunk_size: Maximum rows (records plus problems) per chunk
+
+    Yields:
+        (records, problems) tuples in input order
+    """
+    if fmt not in INPUT_FORMATS:
+        raise ValueError(f"fmt must be one of {INPUT_FORMATS}, got {fmt!r}")
+    records: List[Record] = []
+    problems: List[Problem] = []
+    if fmt == "csv":
+        reader = csv.reader(source)
+        rows = ((reader.line_num, row) for row in reader if row)
+        parse = _csv_record
+    else:
+        rows = ((n, text) for n, text in enumerate(source, 1) if text.strip())
+        parse = _jsonl_record
+
+    for line, row in rows:
+        if fmt == "csv" and line == 1 and row[0].strip().lower() == "start":
+            continue
+        try:
+            records.append(parse(line, row))
+        except ValueError as exc:
+            problems.append((line, str(exc)))
+        # Problems count too, so a mostly malformed file stays bounded.
+        if len(records) + len(problems) >= chunk_size:
+            yield records, problems
+            records, problems = [], []
+    if records or problems:
+        yield records, problems
+
+def process_chunk(chunk: Chunk) -> Tuple[List[str], List[Problem]]:
+    """
+    Compute `add_time` for one chunk of records.
+
+    Each row is parsed on its own (through the cached parsers), so a
+    malformed row is reported without slowing down the rest; the good
+    rows are then computed in one `add_time_many` call.
+
+    Returns:
+        (results, problems): one result per row in input order, with an
+        empty string for each malformed row, and the chunk's problems
+        sorted by line number
+    """
+    records, problems = chunk
+    problems = list(problems)
+    results: List[Tuple[int, str]] = [(line, "") for line, _ in problems]
+    lines: List[int] = []
+    starts: List[int] = []
+    durations: List[int] = []
+    days: List[Optional[str]] = []
+    for line, start, duration, day in records:
+        try:
+            start_minutes = _start_minutes(start)
+            duration_minutes = _duration_minutes(duration)
+            if day and day_of_week_convert(day_name=day) is None:
+                raise ValueError(f"Unknown day of week: {day!r}")
+        except (ValueError, TypeError) as exc:
+            problems.append((line, str(exc) or type(exc).__name__))
+            results.append((line, ""))
+            continue
+        lines.append(line)
+        starts.append(start_minutes)
+        durations.append(duration_minutes)
+        days.append(day)
+    if lines:
+        results.extend(zip(lines, add_time_many(starts, durations, days)))
+    results.sort()
+    problems.sort()
+    return [result for _, result in results], problems
+
+def stream_add_time(
+    source: TextIO,
+    sink: TextIO,
+    fmt: str = "csv",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    errors: Optional[TextIO] = None,
+) -> Tuple[int, int]:
+    """
+    Stream records from `source` and write one result line per row to `sink`.
+
+    Malformed rows produce an empty line, so the n-th output line always
+    belongs to the n-th input row (blank lines and the CSV header are
+    not rows). Memory stays bounded by a few chunks regardless of input
+    size. With
+    `workers` > 1, chunks are computed in a process pool, at most two
+    per worker in flight, and results are still written in input order.
+
+    Args:
+        source: Text stream of CSV or JSONL records
+        sink: Text stream receiving results
+        fmt: "csv" or "jsonl"
+        chunk_size: Records per chunk
+        workers: Worker processes; 1 computes in the current process
+        errors: Stream receiving "line N: message" reports for malformed
+            rows (defaults to stderr)
+
+    Returns:
+        (rows with a result, rows reported as malformed)
+    """
+    errors = sys.stderr if errors is None else errors
+    written = failed = 0
+
+    def emit(results: List[str], problems: List[Problem]) -> None:
+        nonlocal written, failed
+        if results:
+            sink.write("\n".join(results) + "\n")
+        for line, message in problems:
+            errors.write(f"line {line}: {message}\n")
+        written += len(results) - len(problems)
+        failed += len(problems)
+
+    chunks = iter_record_chunks(source, fmt, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            emit(*process_chunk(chunk))
+        return written, failed
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(process_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                emit(*pending.popleft().result())
+        while pending:
+            emit(*pending.popleft().result())
+    return written, failed
+
+def _open_text(filename: str, mode: str) -> TextIO:
+    """Open a text file, transparently (de)compressing `.gz` files; "-" is stdin/stdout."""
+    if filename == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding="utf-8", newline="")
+    return open(filename, mode, encoding="utf-8", newline="")
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description="Add durations to 12h start times.")
+    parser.add_argument("input", nargs="?", help='CSV or JSONL file (optionally .gz), or "-" for stdin; runs a demo when omitted')
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=INPUT_FORMATS, help="input format (default: from the file name, else csv)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records per chunk")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes")
+    args = parser.parse_args(argv)
+
+    if args.input is None:
+        _demo()
+        return 0
+    fmt = args.format or ("jsonl" if ".jsonl" in args.input else "csv")
+
+    source = _open_text(args.input, "r")
+    sink = _open_text(args.output, "w")
+    try:
+        _, failed = stream_add_time(source, sink, fmt, args.chunk_size, args.workers)
+    finally:
+        for f in (source, sink):
+            if f not in (sys.stdin, sys.stdout):
+                f.close()
+    return 1 if failed else 0
+
+def _demo() -> None:
     examples = [
         ("3:00 PM", "3:10", None),
         ("11:30 AM", "2:32", "Monday"),
@@ -130,4 +699,8 @@ if __name__ == "__main__":
 
     for start, duration, day in examples:
         result = add_time(start, duration, day)
-        print(f"{start} + {duration}" + (f" ({day})" if day else "") + f" → {result}")
\ No newline at end of file
+        print(f"{start} + {duration}" + (f" ({day})" if day else "") + f" → {result}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Time Calculator Benchmarks
+==========================
+
+Rough timings for the time calculator. Run directly:
+
+    python time_calculator_benchmark.py
+"""
+
+import io
+import random
+import zoneinfo
+from datetime import date, datetime, timedelta, timezone
+from time import perf_counter
+
+from time_calculator import (
+    add_duration_many,
+    add_time,
+    add_time_many,
+    convert_to_minutes,
+    day_of_week_convert,
+    format_days_passed,
+    minutes_to_12h,
+    parse_time_12h,
+    stream_add_time,
+)
+
+
+def _workload(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    days = ["Monday", "tuesday", "saturDAY", None]
+    starts = [f"{rng.randint(1, 12)}:{rng.randrange(60):02d} {rng.choice(('AM', 'PM'))}" for _ in range(size)]
+    durations = [f"{rng.randrange(500)}:{rng.randrange(60):02d}" for _ in range(size)]
+    weekdays = [rng.choice(days) for _ in range(size)]
+    return starts, durations, weekdays
+
+
+def bench_batch(sizes=(10_000, 100_000, 1_000_000)) -> None:
+    """Compare add_time_many with a loop over add_time."""
+    print("Batch add_time")
+    for size in sizes:
+        starts, durations, weekdays = _workload(size)
+
+        start = perf_counter()
+        batch = add_time_many(starts, durations, weekdays)
+        batched = perf_counter() - start
+
+        start = perf_counter()
+        scalar = [add_time(s, d, w) for s, d, w in zip(starts, durations, weekdays)]
+        looped = perf_counter() - start
+
+        assert batch == scalar, "batch results differ from add_time"
+        print(
+            f"  {size:>9,} rows | batch {size / batched:10,.0f} rows/s "
+            f"| loop {size / looped:10,.0f} rows/s | speedup {looped / batched:4.1f}x"
+        )
+
+
+def _legacy_day_of_week_convert(day_name=None, day_number=None):
+    """The table-free conversion add_time used before lookup tables."""
+    days = {"sunday": 1, "monday": 2, "tuesday": 3, "wednesday": 4, "thursday": 5, "friday": 6, "saturday": 7}
+    if day_name:
+        return days.get(day_name.strip().lower())
+    return next((k for k, v in days.items() if v == day_number), None)
+
+
+def _legacy_add_time(start, duration, day_of_week=None):
+    """add_time as it was before lookup tables and parse caching."""
+    start_total = convert_to_minutes(*parse_time_12h(start))
+    hours, minutes = map(int, duration.split(":"))
+    total = start_total + hours * 60 + minutes
+    days_passed = total // (24 * 60)
+    hour, minute, am_pm = minutes_to_12h(total)
+    parts = [f"{hour}:{minute:02d} {am_pm}"]
+    if day_of_week:
+        number = (_legacy_day_of_week_convert(day_name=day_of_week) - 1 + days_passed) % 7 + 1
+        parts.append(_legacy_day_of_week_convert(day_number=number).title())
+    if days_passed:
+        parts.append(format_days_passed(days_passed))
+    if len(parts) == 1:
+        return parts[0]
+    if len(parts) == 2:
+        return f"{parts[0]}, {parts[1]}"
+    return f"{parts[0]}, {parts[1]} {parts[2]}"
+
+
+def bench_latency(calls: int = 200_000) -> None:
+    """Report per-call latency of the old and table-driven implementations."""
+    print("Per-call latency")
+    starts, durations, weekdays = _workload(1_000)
+    rows = [(starts[i % 1_000], durations[i % 1_000], weekdays[i % 1_000]) for i in range(calls)]
+    cases = (
+        ("day_of_week_convert (name)", lambda: _legacy_day_of_week_convert("Friday"), lambda: day_of_week_convert("Friday")),
+        ("day_of_week_convert (number)", lambda: _legacy_day_of_week_convert(day_number=6), lambda: day_of_week_convert(day_number=6)),
+    )
+    for label, before, after in cases:
+        timings = []
+        for fn in (before, after):
+            start = perf_counter()
+            for _ in range(calls):
+                fn()
+            timings.append((perf_counter() - start) / calls)
+        print(f"  {label:<28} | before {timings[0] * 1e9:7.0f} ns | after {timings[1] * 1e9:7.0f} ns")
+
+    timings = []
+    for fn in (_legacy_add_time, add_time):
+        start = perf_counter()
+        for row in rows:
+            fn(*row)
+        timings.append((perf_counter() - start) / calls)
+    print(f"  {'add_time':<28} | before {timings[0] * 1e9:7.0f} ns | after {timings[1] * 1e9:7.0f} ns")
+
+
+def bench_streaming(size: int = 1_000_000, workers=(1, 2, 4)) -> None:
+    """Report throughput of the streaming pipeline over an in-memory CSV."""
+    print("Streaming pipeline")
+    starts, durations, weekdays = _workload(size)
+    text = "".join(f"{s},{d},{w or ''}\n" for s, d, w in zip(starts, durations, weekdays))
+    for count in workers:
+        sink = io.StringIO()
+        start = perf_counter()
+        written, _ = stream_add_time(io.StringIO(text), sink, workers=count)
+        elapsed = perf_counter() - start
+        print(f"  {count} workers | {written:,} rows | {written / elapsed:10,.0f} rows/s")
+
+
+def bench_zones(size: int = 200_000, tz: str = "America/New_York") -> None:
+    """Compare the cached-transition engine with per-row zoneinfo arithmetic."""
+    print("Timezone-aware durations")
+    rng = random.Random(0)
+    starts, _, _ = _workload(size)
+    durations = [rng.randrange(60 * 24 * 30) for _ in range(size)]
+    dates = [date(2024, 1, 1) + timedelta(days=rng.randrange(366)) for _ in range(size)]
+
+    start = perf_counter()
+    add_duration_many(starts, durations, dates=dates, tz=tz)
+    cached = perf_counter() - start
+
+    zone = zoneinfo.ZoneInfo(tz)
+    start = perf_counter()
+    for text, minutes, day in zip(starts, durations, dates):
+        clock = datetime.strptime(text, "%I:%M %p").time()
+        local = datetime.combine(day, clock, tzinfo=zone)
+        moment = (local.astimezone(timezone.utc) + timedelta(minutes=minutes)).astimezone(zone)
+        moment.strftime("%I:%M %p %Z, %A %Y-%m-%d")
+    per_row = perf_counter() - start
+    print(
+        f"  {size:,} rows | cached tables {size / cached:10,.0f} rows/s "
+        f"| datetime + zoneinfo {size / per_row:10,.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    bench_latency()
+    bench_batch()
+    bench_streaming()
+    bench_zones()